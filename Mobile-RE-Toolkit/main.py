@@ -15,10 +15,27 @@ import re
 import subprocess
 import shutil
 import shlex
+import functools
+import operator
+import pickle
+import bisect
+import multiprocessing
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple
-from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Dict, Tuple, Iterator
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
 
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
@@ -29,13 +46,26 @@ from textual.widgets import (
 from textual.binding import Binding
 from textual.reactive import reactive
 from textual.message import Message
-from textual import on
+from textual.timer import Timer
+from textual.widgets.data_table import ColumnKey
+from textual import on, work
 
 # Resolve paths relative to this file
 HERE = Path(__file__).resolve().parent
 SCRIPT_DIR = (HERE / "scripts").resolve()
 GITIGNORE_PATH = (HERE / ".gitignore").resolve()
 
+# Import destinations by file type (see MRETApp._import_dir_for)
+SRC_DIR = HERE / "src"
+APK_OUTPUT_DIR = SRC_DIR / "output" / "pulled_apks"
+APK_DIR = SRC_DIR / "pulled_apks"  # Used when APK_OUTPUT_DIR doesn't exist
+FRIDA_SCRIPTS_DIR = SCRIPT_DIR / "Android" / "Frida Script Downloader" / "scripts"
+IMPORT_DIRS = {
+    ".ipa": SRC_DIR / "ipa",  # iOS apps
+    ".ab": SRC_DIR / "backups",  # Android backups
+    ".dex": SRC_DIR / "dex",
+}
+
 BANNER = """
 ███╗   ███╗ ██████╗  ███████╗ ████████╗
 ████╗ ████║ ██╔══██╗ ██╔════╝ ╚══██╔══╝
@@ -46,36 +76,155 @@ BANNER = """
 """
 
 PLATFORMS = ["All", "Android", "iOS", "Misc"]
+TABLE_CHUNK_SIZE = 50  # Rows materialized past the visible end of the scripts table
+SEARCH_DEBOUNCE = 0.15  # Seconds of idle typing before the filter runs
 PLATFORM_ICONS = {"All": "🌐", "Android": "🤖", "iOS": "🍎", "Misc": "📁"}
 BOLD_RE = re.compile(r"\*\*(.+?)\*\*", flags=re.DOTALL)
-_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+_BACKTICK_RE = re.compile(r"`([^`]+)`")
+_PARALLEL_ANALYZE_THRESHOLD = 200
+# Discovery runs on a Textual worker thread; forking a threaded process can deadlock
+_ANALYZE_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+# Short queries on catalogs this large scan one joined string instead of each script
+_BULK_SEARCH_THRESHOLD = 1000
+# analyze_script only reads this much from the start and end of each script
+_HEAD_BYTES = 8192
+_TAIL_BYTES = 4096
+# Per-script analysis results persisted between launches
+ANALYSIS_CACHE_PATH = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "mret" / "scripts.pkl"
+_ANALYSIS_CACHE_VERSION = 2  # Bump whenever analyze_script's rules change
+_analysis_cache: Optional[Dict[str, tuple]] = None
+_analysis_cache_dirty = False
+SCRIPT_PLATFORMS = ["Android", "iOS", "Misc"]
+# Helper-package directories that never contain entry point scripts
+_SKIP_DIRS = frozenset({
+    "geiger", "utils", "core", "detectors", "analyzers",
+    "reporters", "scanners", "__pycache__",
+})
+# Module names that are never entry point scripts
+_SKIP_MODULE_NAMES = frozenset({"__init__.py", "config.py", "utils.py", "core.py"})
+
+# Script markers, e.g. "# MRET: args_info: <description>". Compiled once and
+# matched in a single pass per file by analyze_script().
+_MRET_RE = re.compile(
+    rb"#\s*MRET:\s*(no_args|requires_args|args_info|platforms)[ \t]*:?[ \t]*(.*)$",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Common argument parsing patterns, matched together by _arg_parser_detected().
+# Most common first, with shared prefixes factored so the stdlib fallback
+# tries fewer alternatives at each position.
+_ARG_PATTERNS = [
+    rb"argparse\.ArgumentParser",
+    rb"ArgumentParser\(\)",
+    rb"add_argument",
+    rb"sys\.argv\[",
+    rb"typer\.(?:Typer|Option|Argument)",
+    rb"@app\.command",
+    rb"@click\.",
+]
+# Entry point markers, searched together in a single pass
+_MAIN_RE = re.compile(b"|".join(re.escape(marker) for marker in (
+    b'if __name__ == "__main__"',
+    b"if __name__ == '__main__'",
+    b"typer.Typer",
+    b"argparse.ArgumentParser",
+    b"@click.command",
+)))
 
 
-@dataclass
+@dataclass(slots=True)
 class ScriptInfo:
     """Information about a discovered script."""
     path: Path
     name: str
-    description: str
     platform: str
     requires_args: bool
     args_info: str = ""  # Documentation for arguments
     supported_platforms: Optional[List[str]] = None  # Platforms this script supports (for cross-platform scripts)
+    display_path: str = ""  # Script folder relative to the toolkit root
+    args_display: str = ""  # args_info formatted for the details panel
+    name_lower: str = field(init=False)  # Sort/dedup key, computed once
+    _desc_lower: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _display_desc: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    platform_multi: str = field(init=False)  # Platform cell when listed under "All"
     
     def __post_init__(self):
+        self.name_lower = self.name.lower()
         if self.supported_platforms is None:
             self.supported_platforms = [self.platform]
+        self.platform_multi = "🔄 Multi" if len(self.supported_platforms) > 1 else self.platform
+        if self.args_info and not self.args_display:
+            # Convert | separator to newlines for multi-line display
+            self.args_display = self.args_info.replace(" | ", "\n   • ").replace("|", "\n   • ")
     
     @property
     def folder(self) -> Path:
         return self.path.parent
     
+    @property
+    def description(self) -> str:
+        """README description, looked up on first use and cached per folder."""
+        return get_description_from_readme(self.folder)
+    
+    @property
+    def desc_lower(self) -> str:
+        """Lowercased description for search, computed on first use."""
+        if self._desc_lower is None:
+            self._desc_lower = self.description.lower()
+        return self._desc_lower
+    
+    @property
+    def display_desc(self) -> str:
+        """Description truncated for the scripts table, computed on first use."""
+        if self._display_desc is None:
+            desc = self.description
+            self._display_desc = desc[:60] + "..." if len(desc) > 60 else desc
+        return self._display_desc
+    
     @property
     def is_cross_platform(self) -> bool:
         """Check if this script supports multiple platforms."""
         return len(self.supported_platforms) > 1
 
 
+def build_trigram_index(scripts: List[ScriptInfo]) -> Dict[str, set]:
+    """Map each 3-char substring of name/description to the indices of scripts containing it."""
+    index: Dict[str, set] = {}
+    for i, script in enumerate(scripts):
+        for text in (script.name_lower, script.desc_lower):
+            for gram in {text[j:j + 3] for j in range(len(text) - 2)}:
+                index.setdefault(gram, set()).add(i)
+    return index
+
+
+def build_search_corpus(scripts: List[ScriptInfo]) -> Tuple[str, List[int]]:
+    """Join every script's lowercase name and description into one string.
+    
+    Returns the string and the offset each script's record starts at.
+    Fields are NUL-separated and records newline-terminated, so a
+    (single-line) query can't match across them.
+    """
+    records = [f"{s.name_lower}\x00{s.desc_lower}\n" for s in scripts]
+    starts = []
+    pos = 0
+    for record in records:
+        starts.append(pos)
+        pos += len(record)
+    return "".join(records), starts
+
+
+def search_corpus(corpus: str, starts: List[int], query: str) -> List[int]:
+    """Indices of the records in a build_search_corpus() string containing query."""
+    hits = []
+    pos = corpus.find(query)
+    while pos != -1:
+        i = bisect.bisect_right(starts, pos) - 1
+        hits.append(i)
+        if i + 1 == len(starts):
+            break
+        pos = corpus.find(query, starts[i + 1])  # Skip the rest of this record
+    return hits
+
+
 def prettify_script_name(filename: str) -> str:
     """Convert filename to display name."""
     return filename.replace("_", " ").replace(".py", "").title()
@@ -83,21 +232,21 @@ def prettify_script_name(filename: str) -> str:
 
 def find_readme(folder: Path) -> Path | None:
     """Find README file in a folder."""
-    for name in ("README.md", "Readme.md", "readme.md", "README", "Readme", "readme"):
-        p = folder / name
-        if p.is_file():
-            return p
-    cand = sorted(
-        list(folder.glob("README*.md"))
-        + list(folder.glob("readme*.md"))
-        + list(folder.glob("Readme*.md"))
-    )
-    return cand[0] if cand else None
+    try:
+        with os.scandir(folder) as it:
+            names = [e.name for e in it if e.name.lower().startswith("readme") and e.is_file()]
+    except OSError:
+        return None
+    if not names:
+        return None
+    # Prefer Markdown, then the plainest name (README.md over README_old.md)
+    return folder / min(names, key=lambda n: (not n.lower().endswith(".md"), len(n), n))
 
 
-def get_description_from_readme(folder_path: Path) -> str:
-    """Extract description from README's first bold segment."""
-    readme = find_readme(folder_path)
+@functools.lru_cache(maxsize=None)
+def _desc_for_folder(folder_str: str) -> str:
+    """Cached README description lookup, keyed by folder path."""
+    readme = find_readme(Path(folder_str))
     if not readme:
         return "No description available"
     try:
@@ -108,153 +257,242 @@ def get_description_from_readme(folder_path: Path) -> str:
     if not m:
         return "No description available"
     desc = m.group(1).strip()
-    desc = re.sub(r"`([^`]+)`", r"\1", desc)
+    if "`" in desc:
+        desc = _BACKTICK_RE.sub(r"\1", desc)
     desc = " ".join(desc.split())
     return desc or "No description available"
 
 
-def get_script_args_info(script_path: Path) -> str:
-    """Extract argument documentation from script using MRET marker.
-    
-    Looks for: # MRET: args_info: <description>
-    """
-    try:
-        if not script_path.exists():
-            return ""
-        
-        content = script_path.read_text(encoding="utf-8", errors="ignore")
-        
-        # Look for args_info marker
-        match = re.search(r"#\s*MRET:\s*args_info:\s*(.+)$", content, re.MULTILINE | re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-        
-        return ""
-    except Exception:
-        return ""
+def get_description_from_readme(folder_path: Path) -> str:
+    """Extract description from README's first bold segment."""
+    return _desc_for_folder(str(folder_path))
 
 
-def get_script_platforms(script_path: Path, default_platform: str) -> List[str]:
-    """Extract supported platforms from script using MRET marker.
-    
-    Looks for: # MRET: platforms: Android, iOS
-    Returns list of platforms, or [default_platform] if not specified.
+def _build_arg_detector():
+    """Build a matcher that checks all argument parsing patterns in one pass.
+
+    Prefers Hyperscan, then RE2 (both non-backtracking, linear in file size)
+    and falls back to a single ``re`` alternation.
     """
-    try:
-        if not script_path.exists():
-            return [default_platform]
-        
-        content = script_path.read_text(encoding="utf-8", errors="ignore")
-        
-        # Look for platforms marker
-        match = re.search(r"#\s*MRET:\s*platforms:\s*(.+)$", content, re.MULTILINE | re.IGNORECASE)
-        if match:
-            platforms_str = match.group(1).strip()
-            # Parse comma-separated platforms
-            platforms = [p.strip() for p in platforms_str.split(",")]
-            # Validate platforms
-            valid = [p for p in platforms if p in ["Android", "iOS", "Misc"]]
-            return valid if valid else [default_platform]
-        
-        return [default_platform]
-    except Exception:
-        return [default_platform]
+    if HAS_HYPERSCAN:
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=_ARG_PATTERNS,
+                ids=list(range(len(_ARG_PATTERNS))),
+                elements=len(_ARG_PATTERNS),
+                flags=[0] * len(_ARG_PATTERNS),
+            )
+        except hyperscan.error:
+            pass
+        else:
+            def detect(content: bytes) -> bool:
+                try:
+                    # Returning True from the handler stops at the first match
+                    db.scan(content, match_event_handler=lambda *_: True)
+                except hyperscan.ScanTerminated:
+                    return True
+                return False
+            return detect
 
+    pattern = b"|".join(_ARG_PATTERNS)
+    compiled = re2.compile(pattern) if HAS_RE2 else re.compile(pattern)
+    return lambda content: compiled.search(content) is not None
 
-def check_script_requires_args(script_path: Path, visited: Optional[set] = None) -> bool:
-    """Check if a script requires command-line arguments.
-    
-    Detection methods (in priority order):
+
+_arg_parser_detected = _build_arg_detector()
+
+
+def analyze_script(script_path: str | Path) -> Tuple[bool, str, List[str], bool]:
+    """Read a script once and extract everything discovery needs.
+
+    Returns ``(requires_args, args_info, platforms, is_main)``. ``platforms``
+    is empty when the script has no valid ``# MRET: platforms:`` marker.
+    Helper modules are rejected by name before the file is opened; helper
+    package directories are already left out by :func:`_iter_py_scripts`.
+
+    Only the head of the file (where MRET markers and imports live) and its
+    tail (where the ``__main__`` guard and CLI setup usually sit) are read.
+
+    Args detection (in priority order):
     1. # MRET: no_args      -> Force OFF (no args indicator)
     2. # MRET: requires_args -> Force ON (show args indicator)
     3. Auto-detection of argparse, typer, click, sys.argv usage
     """
-    if visited is None:
-        visited = set()
-    
-    script_str = str(script_path)
-    if script_str in visited:
-        return False
-    visited.add(script_str)
-    
+    if os.path.basename(script_path) in _SKIP_MODULE_NAMES:
+        return False, "", [], False
     try:
-        if not script_path.exists():
-            return False
-        
-        content = script_path.read_text(encoding="utf-8", errors="ignore")
-        
-        # Check for explicit "no args" marker (highest priority - overrides everything)
-        if re.search(r"#\s*MRET:\s*no_args", content, re.IGNORECASE):
-            return False
-        
-        # Check for explicit "requires args" marker
-        if re.search(r"#\s*MRET:\s*requires_args", content, re.IGNORECASE):
-            return True
-        
-        # Auto-detect common argument parsing patterns
-        patterns = [
-            r"argparse\.ArgumentParser",
-            r"typer\.Typer",
-            r"@click\.",
-            r"sys\.argv\[",
-            r"ArgumentParser\(\)",
-            r"add_argument",
-            r"@app\.command",
-            r"typer\.Option",
-            r"typer\.Argument",
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, content):
-                return True
-        
-        return False
-    except Exception:
-        return False
+        with open(script_path, "rb") as f:
+            head = f.read(_HEAD_BYTES)
+            tail = b""
+            if len(head) == _HEAD_BYTES:
+                size = os.fstat(f.fileno()).st_size
+                if size > _HEAD_BYTES:
+                    # Overlap slightly so a needle can't straddle the two reads
+                    f.seek(max(_HEAD_BYTES - 64, size - _TAIL_BYTES))
+                    tail = f.read(_TAIL_BYTES)
+    except OSError:
+        return False, "", [], False
+    return _analyze_content(head, tail)
 
 
-def _is_main_script(file_path: Path, base_dir: Path) -> bool:
-    """Check if a Python file is a main entry point script."""
-    filename = file_path.name
-    
-    if filename == "__init__.py":
-        return False
-    
+def _analyze_content(head: bytes, tail: bytes = b"") -> Tuple[bool, str, List[str], bool]:
+    """Marker and entry point detection over a script's raw head/tail bytes.
+
+    Only the small captured marker values are decoded.
+    """
+    no_args = forced_args = False
+    args_info = ""
+    platforms: Optional[List[str]] = None
+    for m in _MRET_RE.finditer(head):
+        marker = m.group(1).lower()
+        value = m.group(2).decode("utf-8", "ignore").strip()
+        if marker == b"no_args":
+            no_args = True
+        elif marker == b"requires_args":
+            forced_args = True
+        elif marker == b"args_info" and value and not args_info:
+            args_info = value
+        elif marker == b"platforms" and value and platforms is None:
+            # Parse comma-separated platforms, keeping only known ones
+            platforms = [p for p in (p.strip() for p in value.split(",")) if p in SCRIPT_PLATFORMS]
+
+    if no_args:
+        requires_args = False
+    elif forced_args:
+        requires_args = True
+    else:
+        requires_args = _arg_parser_detected(head) or (bool(tail) and _arg_parser_detected(tail))
+
+    is_main = _MAIN_RE.search(head) is not None or _MAIN_RE.search(tail) is not None
+    return requires_args, args_info if requires_args else "", platforms or [], is_main
+
+
+def _iter_py_scripts(base: Path, skip_dirs: frozenset = frozenset()) -> Iterator[Tuple[str, str, bool]]:
+    """Yield ``(dirpath, filename, in_skip_dir)`` for all ``.py`` files under ``base``.
+
+    Uses ``os.scandir`` directly so file/dir checks come from the cached
+    directory entry. Directories named in ``skip_dirs`` are still walked (the
+    WIP scan covers them), but their files are flagged ``in_skip_dir``.
+    """
+    stack = [(str(base), False)]
+    while stack:
+        dirpath, in_skip_dir = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, in_skip_dir or entry.name in skip_dirs))
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        yield dirpath, entry.name, in_skip_dir
+        except OSError:
+            continue
+
+
+# Per-platform ``(script listing, WIP dirpaths)`` shared by the WIP scan and
+# discovery, so the tree is walked once per launch. Cleared by refresh_script_tree().
+_script_tree: Dict[str, Tuple[List[Tuple[str, str]], List[str]]] = {}
+
+
+def _scan_platform_tree(plat: str) -> Tuple[List[Tuple[str, str]], List[str]]:
+    """Walk a platform's tree once, caching its script listing and WIP directories."""
+    scanned = _script_tree.get(plat)
+    if scanned is None:
+        listing, wip_dirs = [], []
+        for dirpath, filename, in_skip_dir in _iter_py_scripts(SCRIPT_DIR / plat, _SKIP_DIRS):
+            # WIP files count anywhere, helper packages included
+            if "WIP" in filename:
+                wip_dirs.append(dirpath)
+            if not in_skip_dir:
+                listing.append((dirpath, filename))
+        scanned = _script_tree[plat] = (listing, wip_dirs)
+    return scanned
+
+
+def _platform_scripts(plat: str) -> List[Tuple[str, str]]:
+    """Return the cached ``(dirpath, filename)`` listing for a platform."""
+    return _scan_platform_tree(plat)[0]
+
+
+def refresh_script_tree() -> None:
+    """Forget cached listings so the next scan re-walks the scripts tree."""
+    _script_tree.clear()
+
+
+def _load_analysis_cache() -> Dict[str, tuple]:
+    """Load the on-disk analysis cache (once per process)."""
+    global _analysis_cache
+    if _analysis_cache is None:
+        try:
+            with ANALYSIS_CACHE_PATH.open("rb") as f:
+                version, _analysis_cache = pickle.load(f)
+            # Results from an older analyze_script are discarded
+            if version != _ANALYSIS_CACHE_VERSION or not isinstance(_analysis_cache, dict):
+                _analysis_cache = {}
+        except Exception:
+            _analysis_cache = {}
+    return _analysis_cache
+
+
+def _save_analysis_cache() -> None:
+    """Write the analysis cache back to disk if anything changed."""
+    global _analysis_cache_dirty
+    if not _analysis_cache_dirty or _analysis_cache is None:
+        return
     try:
-        rel_path = file_path.relative_to(base_dir)
-        path_parts = rel_path.parts
-    except ValueError:
-        path_parts = file_path.parts
-    
-    skip_dirs = ["geiger", "utils", "core", "detectors", "analyzers", 
-                 "reporters", "scanners", "__pycache__"]
-    
-    if len(path_parts) > 2:
-        for part in path_parts[:-2]:
-            if part in skip_dirs:
-                return False
-    
-    if len(path_parts) >= 2:
-        parent_dir = path_parts[-2]
-        if parent_dir in skip_dirs:
-            return False
+        ANALYSIS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = ANALYSIS_CACHE_PATH.with_suffix(".tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump((_ANALYSIS_CACHE_VERSION, _analysis_cache), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, ANALYSIS_CACHE_PATH)
+        _analysis_cache_dirty = False
+    except OSError:
+        pass
+
+
+def _analyze_scripts(paths: List[str]) -> List[Tuple[bool, str, List[str], bool]]:
+    """Run analyze_script over paths, reusing cached results for unchanged files.
+
+    Cache entries are keyed by path and validated against ``(mtime_ns, size)``.
+    """
+    global _analysis_cache_dirty
+    cache = _load_analysis_cache()
+    analyses: List[Optional[tuple]] = [None] * len(paths)
+    stale: List[Tuple[int, str, Tuple[int, int]]] = []
+    for i, path_str in enumerate(paths):
+        try:
+            st = os.stat(path_str)
+        except OSError:
+            analyses[i] = (False, "", [], False)
+            continue
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = cache.get(path_str)
+        if cached is not None and cached[0] == stamp:
+            analyses[i] = cached[1]
+        else:
+            stale.append((i, path_str, stamp))
     
-    skip_module_names = ["config.py", "utils.py", "core.py"]
-    if filename in skip_module_names:
-        return False
+    if not stale:
+        return analyses
     
-    try:
-        content = file_path.read_text(encoding="utf-8", errors="ignore")
-        has_main = (
-            'if __name__ == "__main__"' in content or
-            "if __name__ == '__main__'" in content or
-            'typer.Typer' in content or
-            'argparse.ArgumentParser' in content or
-            '@click.command' in content
-        )
-        return has_main
-    except Exception:
-        return len(path_parts) <= 2
+    stale_paths = [paths[i] for i, _, _ in stale]
+    # Reading and regex-matching scripts is CPU-bound, so only large trees
+    # are worth the process pool startup cost
+    fresh = None
+    if len(stale_paths) > _PARALLEL_ANALYZE_THRESHOLD:
+        try:
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context(_ANALYZE_START_METHOD)) as pool:
+                fresh = list(pool.map(analyze_script, stale_paths, chunksize=16))
+        except Exception:
+            fresh = None
+    if fresh is None:
+        fresh = [analyze_script(p) for p in stale_paths]
+    
+    for (i, path_str, stamp), result in zip(stale, fresh):
+        analyses[i] = result
+        cache[path_str] = (stamp, result)
+    _analysis_cache_dirty = True
+    return analyses
 
 
 def discover_scripts(platform: str = "All", deduplicate: bool = True) -> List[ScriptInfo]:
@@ -273,60 +511,58 @@ def discover_scripts(platform: str = "All", deduplicate: bool = True) -> List[Sc
         platforms_to_scan = [platform]
     
     def scan_platform(plat: str) -> List[ScriptInfo]:
-        base_dir = SCRIPT_DIR / plat
         results = []
-        if not base_dir.is_dir():
-            return results
+        # Plain strings until a script is accepted; only then build a Path
+        entries = [
+            (os.path.join(dirpath, filename), dirpath, filename)
+            for dirpath, filename in _platform_scripts(plat)
+            if filename not in _SKIP_MODULE_NAMES
+        ]
+        analyses = _analyze_scripts([path_str for path_str, _, _ in entries])
         
-        for root, _, files in os.walk(base_dir):
-            for file in files:
-                if file.endswith(".py"):
-                    file_path = Path(root) / file
-                    if _is_main_script(file_path, base_dir):
-                        name = prettify_script_name(file)
-                        desc = get_description_from_readme(file_path.parent)
-                        requires_args = check_script_requires_args(file_path)
-                        args_info = get_script_args_info(file_path) if requires_args else ""
-                        supported_platforms = get_script_platforms(file_path, plat)
-                        results.append(ScriptInfo(
-                            path=file_path,
-                            name=name,
-                            description=desc,
-                            platform=plat,
-                            requires_args=requires_args,
-                            args_info=args_info,
-                            supported_platforms=supported_platforms
-                        ))
+        for (path_str, dirpath, filename), (requires_args, args_info, platforms, is_main) in zip(entries, analyses):
+            if not is_main:
+                continue
+            results.append(ScriptInfo(
+                path=Path(path_str),
+                name=prettify_script_name(filename),
+                platform=plat,
+                requires_args=requires_args,
+                args_info=args_info,
+                supported_platforms=list(platforms) or [plat],
+                display_path=os.path.relpath(dirpath, HERE),
+            ))
         return results
 
-    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
-        futures = {executor.submit(scan_platform, p): p for p in platforms_to_scan}
-        for future in as_completed(futures):
-            try:
-                scripts.extend(future.result())
-            except Exception:
-                pass
+    # Deduplicate cross-platform scripts when showing "All", merging as each
+    # platform is scanned. Platform lists are kept as ordered sets until the end.
+    dedup = platform == "All" and deduplicate
+    merged: Dict[str, ScriptInfo] = {}
+    merged_platforms: Dict[str, Dict[str, None]] = {}
+    for plat in platforms_to_scan:
+        for script in scan_platform(plat):
+            if not dedup:
+                scripts.append(script)
+                continue
+            name_lower = script.name_lower
+            if name_lower not in merged:
+                merged[name_lower] = script
+                merged_platforms[name_lower] = dict.fromkeys(script.supported_platforms)
+                continue
+            merged_platforms[name_lower].update(dict.fromkeys(script.supported_platforms))
+            # If this script is from Misc, prefer it (it's the "canonical" location)
+            if script.platform == "Misc":
+                merged[name_lower] = script
+    _save_analysis_cache()
 
-    # Deduplicate cross-platform scripts when showing "All"
-    if platform == "All" and deduplicate:
-        seen_names: Dict[str, ScriptInfo] = {}
-        for script in scripts:
-            name_lower = script.name.lower()
-            if name_lower not in seen_names:
-                seen_names[name_lower] = script
-            else:
-                # Prefer the script with more platform support, or keep existing
-                existing = seen_names[name_lower]
-                # Merge supported platforms
-                all_platforms = list(set(existing.supported_platforms + script.supported_platforms))
-                existing.supported_platforms = all_platforms
-                # If this script is from Misc, prefer it (it's the "canonical" location)
-                if script.platform == "Misc":
-                    script.supported_platforms = all_platforms
-                    seen_names[name_lower] = script
-        scripts = list(seen_names.values())
-
-    scripts.sort(key=lambda s: (s.platform, s.name.lower()))
+    if dedup:
+        for name_lower, script in merged.items():
+            script.supported_platforms = list(merged_platforms[name_lower])
+            if script.is_cross_platform:
+                script.platform_multi = "🔄 Multi"
+        scripts = list(merged.values())
+
+    scripts.sort(key=operator.attrgetter("platform", "name_lower"))
     return scripts
 
 
@@ -336,25 +572,21 @@ def scan_wip_and_update_gitignore() -> int:
     if not SCRIPT_DIR.is_dir():
         return 0
     
-    for plat in ["Android", "iOS", "Misc"]:
-        plat_dir = SCRIPT_DIR / plat
-        if not plat_dir.is_dir():
-            continue
-        for root, _, files in os.walk(plat_dir):
-            for file in files:
-                if "WIP" in file and file.endswith(".py"):
-                    rel_path = os.path.relpath(root, HERE)
-                    wip_dirs.add(rel_path)
+    for plat in SCRIPT_PLATFORMS:
+        for dirpath in _scan_platform_tree(plat)[1]:
+            wip_dirs.add(os.path.relpath(dirpath, HERE))
     
     if wip_dirs:
-        if not GITIGNORE_PATH.exists():
-            GITIGNORE_PATH.write_text("# Git Ignore File\n", encoding="utf-8")
-        existing = set(GITIGNORE_PATH.read_text(encoding="utf-8").splitlines())
-        new_entries = [d for d in wip_dirs if d not in existing]
+        try:
+            content = GITIGNORE_PATH.read_bytes()
+        except FileNotFoundError:
+            content = b"# Git Ignore File\n"
+        existing = set(content.splitlines())
+        new_entries = [os.fsencode(d) for d in wip_dirs if os.fsencode(d) not in existing]
         if new_entries:
-            with GITIGNORE_PATH.open("a", encoding="utf-8") as f:
-                f.write("\n# Auto-added WIP script directories\n")
-                f.write("\n".join(new_entries) + "\n")
+            GITIGNORE_PATH.write_bytes(
+                content + b"\n# Auto-added WIP script directories\n" + b"\n".join(new_entries) + b"\n"
+            )
     
     return len(wip_dirs)
 
@@ -362,15 +594,38 @@ def scan_wip_and_update_gitignore() -> int:
 def organize_scripts():
     """Organize loose scripts into folders."""
     SCRIPT_DIR.mkdir(parents=True, exist_ok=True)
-    for filename in os.listdir(SCRIPT_DIR):
+    with os.scandir(SCRIPT_DIR) as it:
+        loose = [entry.name for entry in it if entry.name.endswith(".py") and entry.is_file()]
+    for filename in loose:
         file_path = SCRIPT_DIR / filename
-        if filename.endswith(".py") and file_path.is_file():
-            script_name = prettify_script_name(filename)
-            dest_folder = SCRIPT_DIR / script_name
-            dest_path = dest_folder / filename
-            dest_folder.mkdir(parents=True, exist_ok=True)
-            if file_path.resolve() != dest_path.resolve():
-                shutil.move(str(file_path), str(dest_path))
+        script_name = prettify_script_name(filename)
+        dest_folder = SCRIPT_DIR / script_name
+        dest_path = dest_folder / filename
+        dest_folder.mkdir(parents=True, exist_ok=True)
+        if file_path.resolve() != dest_path.resolve():
+            shutil.move(str(file_path), str(dest_path))
+
+
+def copy_file(src: Path, dst: Path) -> None:
+    """Copy a file with metadata, letting the kernel move the data where possible.
+    
+    os.copy_file_range copies (or reflinks) in-kernel; shutil.copyfile, which
+    uses sendfile on Linux, is the fallback.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+        except OSError:
+            shutil.copyfile(src, dst)
+    else:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
 
 
 # ============================================================================
@@ -444,6 +699,21 @@ class PlatformSidebar(Vertical):
             self.post_message(self.PlatformSelected(plat))
 
 
+class ScriptsTable(DataTable):
+    """Scripts table whose rows MRETApp adds lazily as it scrolls."""
+    
+    class BottomRequested(Message):
+        """Message sent when the Bottom binding needs rows not added yet."""
+    
+    def action_scroll_bottom(self) -> None:
+        """Let the app add every remaining row before moving to the last one."""
+        self.post_message(self.BottomRequested())
+    
+    def move_to_bottom(self) -> None:
+        """Move the cursor and scroll to the last row present."""
+        super().action_scroll_bottom()
+
+
 class ScriptDetails(Vertical):
     """Panel showing details of selected script."""
     
@@ -498,12 +768,10 @@ class ScriptDetails(Vertical):
             
             self.query_one("#detail-title", Static).update(title)
             self.query_one("#detail-desc", Static).update(script.description)
-            self.query_one("#detail-path", Static).update(f"📁 {script.path.parent.relative_to(HERE)}")
+            self.query_one("#detail-path", Static).update(f"📁 {script.display_path}")
             if script.requires_args:
-                if script.args_info:
-                    # Convert | separator to newlines for multi-line display
-                    args_display = script.args_info.replace(" | ", "\n   • ").replace("|", "\n   • ")
-                    self.query_one("#detail-args", Static).update(f"⚙️  Args:\n   • {args_display}")
+                if script.args_display:
+                    self.query_one("#detail-args", Static).update(f"⚙️  Args:\n   • {script.args_display}")
                 else:
                     self.query_one("#detail-args", Static).update("⚙️  This script accepts command-line arguments")
             else:
@@ -609,6 +877,11 @@ class ArgumentInput(Vertical):
     }
     """
     
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Last (raw value, parsed args) pair, so repeated calls skip shlex
+        self._cached: Tuple[str, List[str]] | None = None
+    
     def compose(self) -> ComposeResult:
         yield Static("Arguments (optional):", id="args-label")
         yield Input(placeholder="e.g., --package com.example.app", id="args-input")
@@ -620,15 +893,21 @@ class ArgumentInput(Vertical):
     def hide(self) -> None:
         self.remove_class("visible")
         self.query_one("#args-input", Input).value = ""
+        self._cached = None
     
     def get_args(self) -> List[str]:
         val = self.query_one("#args-input", Input).value.strip()
+        if self._cached is not None and self._cached[0] == val:
+            return list(self._cached[1])
         if not val:
-            return []
-        try:
-            return shlex.split(val)
-        except ValueError:
-            return val.split()
+            args = []
+        else:
+            try:
+                args = shlex.split(val)
+            except ValueError:
+                args = val.split()
+        self._cached = (val, args)
+        return list(args)
 
 
 # ============================================================================
@@ -752,14 +1031,30 @@ class MRETApp(App):
     ]
     
     current_platform: reactive[str] = reactive("All")
-    scripts: reactive[List[ScriptInfo]] = reactive([])
-    filtered_scripts: reactive[List[ScriptInfo]] = reactive([])
     selected_script: reactive[ScriptInfo | None] = reactive(None)
     
     def __init__(self):
         super().__init__()
         self._script_to_run: ScriptInfo | None = None
         self._script_args: List[str] = []
+        # Plain attributes: nothing watches them, and reactive assignment
+        # would compare whole lists. Mutators refresh the table themselves.
+        self.scripts: List[ScriptInfo] = []
+        # Aliases scripts when unfiltered; never mutated in place
+        self.filtered_scripts: List[ScriptInfo] = []
+        self._query_lower = ""  # Last search query applied to filtered_scripts
+        self._trigram_index: Optional[Dict[str, set]] = None  # Built on first 3+ char query
+        self._search_corpus: Optional[Tuple[str, List[int]]] = None  # Built on first bulk search
+        self._by_path: Dict[str, ScriptInfo] = {}
+        self._scanned = False  # Set once the startup scan has finished
+        self._dest_cache: Dict[str, Path] = {}  # Import folder per file suffix
+        self._status_suffix = ""  # Platform part of the status line, set on platform change
+        # Row key (script path) -> cell values currently shown in the table
+        self._rendered_rows: Dict[str, Tuple[str, ...]] = {}
+        self._materialized = 0  # Leading filtered_scripts entries present in the table
+        self._filling = False  # add_row re-fires the cursor watcher; ignore it meanwhile
+        self._column_keys: List[ColumnKey] = []
+        self._filter_timer: Timer | None = None
     
     def compose(self) -> ComposeResult:
         yield Header()
@@ -781,7 +1076,7 @@ class MRETApp(App):
                     
                     # Scripts table
                     with VerticalScroll(id="scripts-table-container"):
-                        yield DataTable(id="scripts-table", cursor_type="row")
+                        yield ScriptsTable(id="scripts-table", cursor_type="row")
                     
                     # Argument input (hidden by default)
                     yield ArgumentInput(id="arg-input")
@@ -801,67 +1096,172 @@ class MRETApp(App):
         """Initialize the app."""
         # Setup table
         table = self.query_one("#scripts-table", DataTable)
-        table.add_column("#", width=4)
-        table.add_column("Name", width=30)
-        table.add_column("Platform", width=10)
-        table.add_column("Description")
-        table.add_column("Requires Args", width=14)
+        self._column_keys = [
+            table.add_column("#", width=4),
+            table.add_column("Name", width=30),
+            table.add_column("Platform", width=10),
+            table.add_column("Description"),
+            table.add_column("Requires Args", width=14),
+        ]
         table.cursor_type = "row"
+        # Materialize more rows as the view or cursor nears the end
+        self.watch(table, "scroll_y", self._materialize_rows, init=False)
+        self.watch(table, "cursor_coordinate", self._materialize_rows, init=False)
 
-        # Initialize
+        # Scan in the background so the UI paints immediately
+        table.loading = True
+        self.query_one("#status-line", Static).update("🔍 Scanning scripts…")
+        self._startup_scan(self.current_platform)
+    
+    @work(thread=True, exclusive=True)
+    def _startup_scan(self, platform: str) -> None:
+        """Organize, WIP-scan and discover scripts off the UI thread."""
         organize_scripts()
         wip_count = scan_wip_and_update_gitignore()
+        scripts = discover_scripts(platform)
+        # Read every README here; otherwise the first search reads them all on the UI thread
+        for script in scripts:
+            script.desc_lower
+        self.call_from_thread(self._startup_done, wip_count, platform, scripts)
+    
+    def _startup_done(self, wip_count: int, platform: str, scripts: List[ScriptInfo]) -> None:
+        """Show the results of the startup scan."""
+        self._scanned = True
+        self.query_one("#scripts-table", DataTable).loading = False
         if wip_count > 0:
             self.notify(f"Added {wip_count} WIP directories to .gitignore", title="WIP Scan")
-
-        # Load scripts
-        self.load_scripts()
-    
-    def load_scripts(self) -> None:
-        """Load scripts for current platform."""
-        self.scripts = discover_scripts(self.current_platform)
-        self.filtered_scripts = self.scripts.copy()
+        # The platform may have been switched while scanning
+        self.load_scripts(scripts if platform == self.current_platform else None)
+    
+    def load_scripts(self, scripts: Optional[List[ScriptInfo]] = None) -> None:
+        """Load scripts for current platform (or show an already discovered list)."""
+        if not self._scanned:
+            return  # _startup_done loads once the background scan finishes
+        self.scripts = scripts if scripts is not None else discover_scripts(self.current_platform)
+        # Row keys are str(path); covers every row filtered_scripts can show
+        self._by_path = {str(script.path): script for script in self.scripts}
+        self.filtered_scripts = self.scripts
+        self._query_lower = ""
+        self._trigram_index = None
+        self._search_corpus = None
         self.update_table()
         self.update_status()
     
     def update_table(self) -> None:
-        """Update the DataTable with filtered scripts."""
+        """Update the DataTable with filtered scripts.
+        
+        Only the rows up to just past the visible area (or the cursor) are
+        materialized; _materialize_rows adds more as the table scrolls.
+        Rows already shown are diffed by key (script path): stale rows are
+        removed, changed cells updated in place and only new rows added.
+        """
         table = self.query_one("#scripts-table", DataTable)
-        table.clear()
+        # The cursor move and remove_row below fire the cursor watcher; keep
+        # _materialize_rows out until _materialized matches the new list
+        self._filling = True
+        self._materialized = 0
+        try:
+            self._rebuild_rows(table)
+        finally:
+            self._filling = False
+        # Rows must be exactly the leading filtered scripts, or _add_rows appends duplicates
+        assert [row.key.value for row in table.ordered_rows] == [
+            str(script.path) for script in self.filtered_scripts[:self._materialized]
+        ], "scripts table out of sync with filtered_scripts"
+        # The viewport may not be laid out yet on the first call
+        self.call_after_refresh(self._materialize_rows)
+    
+    def _rebuild_rows(self, table: DataTable) -> None:
+        """Diff the table against the leading filtered_scripts rows (update_table's body)."""
+        # A new list starts at the top, as the old clear-and-refill did
+        table.move_cursor(row=0, animate=False)
         
-        for idx, script in enumerate(self.filtered_scripts, 1):
-            # Center the gear icon in the column
-            args_indicator = "     ⚙️" if script.requires_args else ""
-            # Truncate description to fit
-            desc = script.description[:60] + "..." if len(script.description) > 60 else script.description
+        limit = self._row_window(table)
+        desired = {
+            str(script.path): self._row_cells(idx, script)
+            for idx, script in enumerate(self.filtered_scripts[:limit], 1)
+        }
+        # One screen update for all removals, cell edits and additions
+        with self.batch_update():
+            rendered = self._rendered_rows
+            for key in [k for k in rendered if k not in desired]:
+                table.remove_row(key)
+                del rendered[key]
+            for key, cells in rendered.items():
+                new_cells = desired[key]
+                if new_cells != cells:
+                    for column_key, old, new in zip(self._column_keys, cells, new_cells):
+                        if old != new:
+                            table.update_cell(key, column_key, new)
+                    rendered[key] = new_cells
             
-            # Show platform with cross-platform indicator
-            if script.is_cross_platform and self.current_platform == "All":
-                # Show all supported platforms
-                platform_display = "🔄 Multi"
-            else:
-                platform_display = script.platform
-            
-            table.add_row(
-                str(idx),
-                script.name,
-                platform_display,
-                desc,
-                args_indicator,
-                key=str(script.path)
-            )
+            # Rows added next to surviving ones may land out of order
+            needs_sort = bool(rendered)
+            added = False
+            for key, cells in desired.items():
+                if key not in rendered:
+                    table.add_row(*cells, key=key)
+                    rendered[key] = cells
+                    added = True
+            if added and needs_sort:
+                table.sort(self._column_keys[0], key=int)
+        # Rows moved under the cursor without a RowHighlighted event
+        self._show_row(self._cursor_row_key(table))
+        self._materialized = len(desired)
+    
+    def _row_window(self, table: DataTable) -> int:
+        """Number of leading rows that should exist for the current view."""
+        visible_end = max(int(table.scroll_y) + table.size.height, table.cursor_row + 1)
+        return visible_end + TABLE_CHUNK_SIZE
+    
+    def _materialize_rows(self) -> None:
+        """Append filtered rows up to the current window, if any are missing."""
+        if self._filling:
+            return
+        table = self.query_one("#scripts-table", DataTable)
+        self._add_rows(table, min(self._row_window(table), len(self.filtered_scripts)))
+    
+    @on(ScriptsTable.BottomRequested)
+    def on_table_bottom_requested(self, event: ScriptsTable.BottomRequested) -> None:
+        """Add every remaining filtered row so the Bottom binding reaches the last script."""
+        table = self.query_one("#scripts-table", ScriptsTable)
+        self._add_rows(table, len(self.filtered_scripts))
+        table.move_to_bottom()
+    
+    def _add_rows(self, table: DataTable, limit: int) -> None:
+        """Append filtered rows from the last materialized one up to limit."""
+        self._filling = True
+        try:
+            with self.batch_update():
+                for idx in range(self._materialized, limit):
+                    script = self.filtered_scripts[idx]
+                    key = str(script.path)
+                    cells = self._row_cells(idx + 1, script)
+                    table.add_row(*cells, key=key)
+                    self._rendered_rows[key] = cells
+        finally:
+            self._filling = False
+        self._materialized = max(self._materialized, limit)
+    
+    def _row_cells(self, idx: int, script: ScriptInfo) -> Tuple[str, ...]:
+        """Cell values for one row of the scripts table."""
+        # Center the gear icon in the column
+        args_indicator = "     ⚙️" if script.requires_args else ""
+        # Show platform with cross-platform indicator
+        platform_display = script.platform_multi if self.current_platform == "All" else script.platform
+        return (str(idx), script.name, platform_display, script.display_desc, args_indicator)
     
     def update_status(self) -> None:
         """Update the status line."""
-        total = len(self.scripts)
-        filtered = len(self.filtered_scripts)
-        status = f"📊 {filtered}/{total} scripts"
-        if self.current_platform != "All":
-            status += f" | Platform: {PLATFORM_ICONS.get(self.current_platform, '')} {self.current_platform}"
-        self.query_one("#status-line", Static).update(status)
+        self.query_one("#status-line", Static).update(
+            f"📊 {len(self.filtered_scripts)}/{len(self.scripts)} scripts{self._status_suffix}"
+        )
     
     def watch_current_platform(self, platform: str) -> None:
         """React to platform change."""
+        self._status_suffix = (
+            f" | Platform: {PLATFORM_ICONS.get(platform, '')} {platform}" if platform != "All" else ""
+        )
         self.load_scripts()
         # Clear search
         search = self.query_one("#search-input", Input)
@@ -874,15 +1274,42 @@ class MRETApp(App):
     
     @on(Input.Changed, "#search-input")
     def on_search_changed(self, event: Input.Changed) -> None:
-        """Filter scripts based on search input."""
-        query = event.value.lower().strip()
+        """Schedule filtering once typing pauses, instead of on every keystroke."""
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(SEARCH_DEBOUNCE, self._apply_filter)
+    
+    def _apply_filter(self) -> None:
+        """Filter scripts based on the current search input."""
+        self._filter_timer = None
+        query = self.query_one("#search-input", Input).value.lower().strip()
+        if query == self._query_lower:
+            return  # Table already reflects this query
+        self._query_lower = query
         
         if not query:
-            self.filtered_scripts = self.scripts.copy()
+            self.filtered_scripts = self.scripts
+        elif len(query) < 3 and len(self.scripts) >= _BULK_SEARCH_THRESHOLD:
+            # One C-level scan over all records beats N per-script checks
+            if self._search_corpus is None:
+                self._search_corpus = build_search_corpus(self.scripts)
+            corpus, starts = self._search_corpus
+            self.filtered_scripts = [self.scripts[i] for i in search_corpus(corpus, starts, query)]
         else:
+            candidates = self.scripts
+            if len(query) >= 3:
+                # Only scripts containing every trigram of the query can match
+                if self._trigram_index is None:
+                    self._trigram_index = build_trigram_index(self.scripts)
+                postings = [
+                    self._trigram_index.get(query[i:i + 3], set())
+                    for i in range(len(query) - 2)
+                ]
+                postings.sort(key=len)
+                candidates = [self.scripts[i] for i in sorted(postings[0].intersection(*postings[1:]))]
             self.filtered_scripts = [
-                s for s in self.scripts
-                if query in s.name.lower() or query in s.description.lower()
+                s for s in candidates
+                if query in s.name_lower or query in s.desc_lower
             ]
         
         self.update_table()
@@ -891,13 +1318,23 @@ class MRETApp(App):
     @on(DataTable.RowHighlighted)
     def on_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         """Update details when row is highlighted."""
-        if event.row_key and event.row_key.value:
-            path = Path(event.row_key.value)
-            for script in self.filtered_scripts:
-                if script.path == path:
-                    self.selected_script = script
-                    self.query_one("#script-details", ScriptDetails).update_details(script)
-                    break
+        # Events posted by remove_row/add_row arrive after update_table has
+        # re-sorted the rows, so their row_key may be stale; trust the cursor
+        self._show_row(self._cursor_row_key(event.data_table))
+    
+    def _cursor_row_key(self, table: DataTable) -> Optional[str]:
+        """Row key (script path) under the table cursor, if any."""
+        if not table.row_count:
+            return None
+        return table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
+    
+    def _show_row(self, row_key: Optional[str]) -> None:
+        """Select the script for a table row key and show its details."""
+        if row_key:
+            script = self._by_path.get(row_key)
+            if script is not None:
+                self.selected_script = script
+                self.query_one("#script-details", ScriptDetails).update_details(script)
         else:
             self.selected_script = None
             self.query_one("#script-details", ScriptDetails).update_details(None)
@@ -905,6 +1342,7 @@ class MRETApp(App):
     @on(DataTable.RowSelected)
     def on_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection (Enter key or double-click)."""
+        self._show_row(event.row_key.value)
         if self.selected_script:
             if self.selected_script.requires_args:
                 # Show argument input
@@ -936,6 +1374,7 @@ class MRETApp(App):
     def action_run_script(self) -> None:
         """Run the currently selected script."""
         table = self.query_one("#scripts-table", DataTable)
+        self._show_row(self._cursor_row_key(table))
         if table.row_count > 0 and self.selected_script:
             if self.selected_script.requires_args:
                 arg_input = self.query_one("#arg-input", ArgumentInput)
@@ -945,6 +1384,10 @@ class MRETApp(App):
     
     def action_refresh(self) -> None:
         """Refresh the script list."""
+        if not self._scanned:
+            return
+        refresh_script_tree()
+        _desc_for_folder.cache_clear()
         self.load_scripts()
         self.notify("Scripts refreshed!", title="Refresh")
     
@@ -1011,69 +1454,61 @@ class MRETApp(App):
                 dest_path = dest_dir / f"{base}_{counter}{ext}"
                 counter += 1
         
+        # Large APKs/IPAs take a while; copy without blocking the UI
+        file_import.hide()
+        self.notify(f"Importing {source_path.name}…", title="Import")
+        self._import_file(source_path, dest_dir, dest_path)
+    
+    @work(thread=True)
+    def _import_file(self, source_path: Path, dest_dir: Path, dest_path: Path) -> None:
+        """Copy an imported file into place off the UI thread."""
         try:
             # Create destination directory if needed
             dest_dir.mkdir(parents=True, exist_ok=True)
             
             # Copy the file
-            shutil.copy2(source_path, dest_path)
-            
-            file_import.hide()
-            self.notify(
-                f"Imported: {source_path.name}\n→ {dest_path.relative_to(HERE)}",
-                title="✅ Import Successful",
-                timeout=5
-            )
-            
-            # Refresh if we might have added something scannable
-            if source_path.suffix.lower() == ".py":
-                self.load_scripts()
-                
+            copy_file(source_path, dest_path)
         except PermissionError:
-            self.notify("Permission denied", title="Import Error", severity="error")
+            self.call_from_thread(self.notify, "Permission denied", title="Import Error", severity="error")
         except Exception as e:
-            self.notify(f"Import failed: {e}", title="Import Error", severity="error")
+            self.call_from_thread(self.notify, f"Import failed: {e}", title="Import Error", severity="error")
+        else:
+            self.call_from_thread(self._import_done, source_path, dest_path)
+    
+    def _import_done(self, source_path: Path, dest_path: Path) -> None:
+        """Report a finished import and rescan if it added a script."""
+        self.notify(
+            f"Imported: {source_path.name}\n→ {dest_path.relative_to(HERE)}",
+            title="✅ Import Successful",
+            timeout=5
+        )
+        
+        # Refresh if we might have added something scannable
+        if source_path.suffix.lower() == ".py":
+            refresh_script_tree()
+            self.load_scripts()
     
     def _get_import_destination(self, source_path: Path) -> Path:
         """Determine the appropriate destination folder based on file type."""
         suffix = source_path.suffix.lower()
-        
-        # APK files go to src/pulled_apks (or src/output/pulled_apks)
+        dest_dir = self._dest_cache.get(suffix)
+        if dest_dir is None:
+            dest_dir = self._dest_cache[suffix] = self._import_dir_for(suffix)
+        return dest_dir
+    
+    def _import_dir_for(self, suffix: str) -> Path:
+        """Resolve (and create) the import folder for a file suffix."""
+        # APK files go to src/output/pulled_apks (or src/pulled_apks)
         if suffix == ".apk":
-            apk_dir = HERE / "src" / "output" / "pulled_apks"
-            if not apk_dir.exists():
-                apk_dir = HERE / "src" / "pulled_apks"
-            apk_dir.mkdir(parents=True, exist_ok=True)
-            return apk_dir
-        
-        # IPA files (iOS) go to src/ipa
-        if suffix == ".ipa":
-            ipa_dir = HERE / "src" / "ipa"
-            ipa_dir.mkdir(parents=True, exist_ok=True)
-            return ipa_dir
-        
-        # Android backup files go to src/backups
-        if suffix == ".ab":
-            backup_dir = HERE / "src" / "backups"
-            backup_dir.mkdir(parents=True, exist_ok=True)
-            return backup_dir
-        
-        # DEX files go to src/dex
-        if suffix == ".dex":
-            dex_dir = HERE / "src" / "dex"
-            dex_dir.mkdir(parents=True, exist_ok=True)
-            return dex_dir
-        
-        # Frida scripts go to the Frida Script Downloader folder
-        if suffix == ".js":
-            frida_dir = SCRIPT_DIR / "Android" / "Frida Script Downloader" / "scripts"
-            if frida_dir.exists():
-                return frida_dir
-        
-        # Default: src folder
-        src_dir = HERE / "src"
-        src_dir.mkdir(parents=True, exist_ok=True)
-        return src_dir
+            dest_dir = APK_OUTPUT_DIR if APK_OUTPUT_DIR.exists() else APK_DIR
+        # Frida scripts go to the Frida Script Downloader folder, if present
+        elif suffix == ".js" and FRIDA_SCRIPTS_DIR.exists():
+            return FRIDA_SCRIPTS_DIR
+        else:
+            # Default: src folder
+            dest_dir = IMPORT_DIRS.get(suffix, SRC_DIR)
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        return dest_dir
     
     def action_quit(self) -> None:
         """Quit the application."""
@@ -17,10 +17,10 @@ DEX mode behavior:
 - Script parses strings and writes CSV next to that .dex (or under output dir if desired).
 """
 
-import os, re, argparse, csv, subprocess, shutil, sys, threading
+import os, re, argparse, csv, subprocess, shutil, sys, functools, struct, mmap, contextlib, heapq, threading
 from pathlib import Path
 from zipfile import ZipFile
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from typing import List, Tuple
 
 from rich.console import Console
@@ -32,6 +32,14 @@ from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.validation import Validator, ValidationError
 
+# Optional C implementation of the fuzzy (subsequence) match
+try:
+    from rapidfuzz import process as rf_process
+    from rapidfuzz.distance import LCSseq
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
 console = Console()
 
 # Locate external tools
@@ -51,8 +59,12 @@ def get_toolkit_root() -> Path:
 TOOLKIT_ROOT = get_toolkit_root()
 OUTPUT_BASE_DIR = str(TOOLKIT_ROOT / "src" / "output")
 
-results_lock = threading.Lock()
-unique_results = set()
+# dex-multi scans at or below these sizes run in-process; pool startup would cost more than it saves
+DEX_SERIAL_MAX_FILES = 2
+DEX_SERIAL_MAX_BYTES = 32 * 1024 * 1024
+
+# CSV outputs can run to millions of rows; a 1 MiB buffer keeps write() calls rare
+CSV_BUFFER_SIZE = 1 << 20
 
 # ---------- Autocomplete helpers ----------
 
@@ -69,36 +81,51 @@ def calculate_match_score(query: str, text: str) -> Tuple[int, int, int, str]:
     3 = Fuzzy match (chars in order)
     4 = No match
     """
-    query_lower = query.lower()
-    text_lower = text.lower()
+    return match_score_lower(query.lower(), text.lower())
+
+
+@functools.lru_cache(maxsize=4096)
+def match_score_lower(query_lower: str, text_lower: str) -> Tuple[int, int, int, str]:
+    """
+    calculate_match_score for already-lowercased inputs.
+    Memoized: completers rescore the same pairs on every redraw.
+    """
+    # A query longer than the text can't match it in any tier
+    if len(query_lower) > len(text_lower):
+        return (4, 0, len(text_lower), text_lower)
     
     # Exact match
     if query_lower == text_lower:
-        return (0, 0, len(text), text_lower)
+        return (0, 0, len(text_lower), text_lower)
     
     # Starts with
     if text_lower.startswith(query_lower):
-        return (1, 0, len(text), text_lower)
+        return (1, 0, len(text_lower), text_lower)
     
     # Contains as substring
     pos = text_lower.find(query_lower)
     if pos != -1:
-        return (2, -pos, len(text), text_lower)
+        return (2, -pos, len(text_lower), text_lower)
     
     # Fuzzy match (characters in order)
-    idx = 0
-    first_match_pos = -1
-    for i, ch in enumerate(text_lower):
-        if idx < len(query_lower) and ch == query_lower[idx]:
-            if first_match_pos == -1:
-                first_match_pos = i
-            idx += 1
+    if HAS_RAPIDFUZZ:
+        # Query is a subsequence iff the LCS covers all of it
+        if LCSseq.similarity(query_lower, text_lower) == len(query_lower):
+            return (3, -text_lower.find(query_lower[0]), len(text_lower), text_lower)
+        return (4, 0, len(text_lower), text_lower)
+    
+    # One str.find per query char; stop as soon as one is missing from the rest of the text
+    first_match_pos = pos = text_lower.find(query_lower[0])
+    for ch in query_lower[1:]:
+        if pos == -1:
+            break
+        pos = text_lower.find(ch, pos + 1)
     
-    if idx == len(query_lower):  # All chars found
-        return (3, -first_match_pos, len(text), text_lower)
+    if pos != -1:  # All chars found
+        return (3, -first_match_pos, len(text_lower), text_lower)
     
     # No match
-    return (4, 0, len(text), text_lower)
+    return (4, 0, len(text_lower), text_lower)
 
 
 class FormatCompleter(Completer):
@@ -175,6 +202,12 @@ class FileCompleter(Completer):
     def __init__(self, files: List[str], file_type: str = "file"):
         self.files = files
         self.file_type = file_type
+        # (index, basename, basename lowercased, path lowercased), built once
+        self._entries = []
+        for i, file_path in enumerate(files, 1):
+            basename = os.path.basename(file_path)
+            self._entries.append((i, basename, basename.lower(), file_path.lower()))
+        self._paths_lower = [entry[3] for entry in self._entries]
     
     def get_completions(self, document, complete_event):
         text = document.text.strip()
@@ -193,24 +226,26 @@ class FileCompleter(Completer):
             return
         
         # Match by filename
+        query_lower = text.lower()
+        entries = self._entries
+        if HAS_RAPIDFUZZ and query_lower:
+            # Batch subsequence test in C: only paths containing the query in order can score,
+            # so the per-entry Python loop below only sees real matches
+            hits = rf_process.extract(query_lower, self._paths_lower, scorer=LCSseq.similarity,
+                                      processor=None, score_cutoff=len(query_lower), limit=None)
+            entries = [entries[idx] for idx in sorted(hit[2] for hit in hits)]
         matches = []
-        for i, file_path in enumerate(self.files, 1):
-            basename = os.path.basename(file_path)
-            full_path = file_path
-            
+        for i, basename, basename_lower, path_lower in entries:
             # Score against both basename and full path
-            score_basename = calculate_match_score(text, basename)
-            score_path = calculate_match_score(text, full_path)
-            score = min(score_basename, score_path)
-            
-            if score[0] < 4:  # Only include actual matches
-                matches.append((score, i, file_path, basename))
-        
-        # Sort by score (best matches first)
-        matches.sort(key=lambda x: x[0])
+            score_path = match_score_lower(query_lower, path_lower)
+            if score_path[0] == 4:
+                # basename is a suffix of the path, so it can't match either
+                continue
+            score = min(match_score_lower(query_lower, basename_lower), score_path)
+            matches.append((score, i, basename))
         
-        # Yield completions (limit to top 10)
-        for score, i, file_path, basename in matches[:10]:
+        # Best 10 by score (stable, like sort()[:10]) without sorting every match
+        for score, i, basename in heapq.nsmallest(10, matches, key=lambda x: x[0]):
             yield Completion(
                 str(i) if text.isdigit() or len(text) == 0 else basename,
                 start_position=-len(document.text),
@@ -347,6 +382,59 @@ def select_format():
 
 # ---------- Discovery helpers ----------
 
+# Directories never worth descending into when hunting for APK/DEX files
+SKIP_DIRS = frozenset({"node_modules", "__pycache__", "venv", ".venv"})
+
+def _find_files(root, suffix, prune=True):
+    """
+    Yield paths of files under root whose lowercased name ends in suffix (a str or tuple).
+    With prune, SKIP_DIRS and hidden directories are not entered.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                # Like os.walk, don't descend into symlinked directories
+                if entry.is_dir(follow_symlinks=False):
+                    if not prune or (name not in SKIP_DIRS and not name.startswith(".")):
+                        stack.append(entry.path)
+                elif name.lower().endswith(suffix) and entry.is_file():
+                    yield entry.path
+
+def _walk_roots(roots):
+    """
+    Existing directories from roots, dropping any that a pruned walk of an earlier
+    root already covers (so src/output is not scanned once per listed ancestor).
+    """
+    kept = []
+    for root in roots:
+        if not root.is_dir():
+            continue
+        covered = False
+        for parent in kept:
+            try:
+                rel = root.relative_to(parent)
+            except ValueError:
+                continue
+            # The walk does not follow symlinks or enter pruned names
+            sub = parent
+            covered = True
+            for part in rel.parts:
+                sub = sub / part
+                if part in SKIP_DIRS or part.startswith(".") or sub.is_symlink():
+                    covered = False
+                    break
+            if covered:
+                break
+        if not covered:
+            kept.append(root)
+    return kept
+
 def find_apks():
     """
     Find .apk files recursively under common search paths.
@@ -367,17 +455,11 @@ def find_apks():
         search_paths.append(docker_data)
     
     apks = []
-    for root in search_paths:
-        if not root.exists() or not root.is_dir():
-            continue
-        # Use os.walk to recursively search through subdirectories
-        for r, _, files in os.walk(str(root)):
-            for file in files:
-                if file.lower().endswith(".apk"):
-                    apks.append(os.path.join(r, file))
-    # De-dup and stable sort
-    dedup = sorted(set(os.path.normpath(p) for p in apks))
-    return dedup
+    for root in _walk_roots(search_paths):
+        # Recursively search through subdirectories, pruning junk trees
+        apks.extend(_find_files(str(root), ".apk"))
+    # De-dup (symlinked roots can repeat a file) and stable sort
+    return sorted(dict.fromkeys(apks))
 
 def find_dex_files():
     """
@@ -399,16 +481,10 @@ def find_dex_files():
         search_roots.append(docker_data)
     
     dex_list = []
-    for root in search_roots:
-        if not root.exists() or not root.is_dir():
-            continue
-        for r, _, files in os.walk(str(root)):
-            for f in files:
-                if f.lower().endswith(".dex"):
-                    dex_list.append(os.path.join(r, f))
-    # De-dup and stable sort
-    dedup = sorted(set(os.path.normpath(p) for p in dex_list))
-    return dedup
+    for root in _walk_roots(search_roots):
+        dex_list.extend(_find_files(str(root), ".dex"))
+    # De-dup (symlinked roots can repeat a file) and stable sort
+    return sorted(dict.fromkeys(dex_list))
 
 def select_apk():
     apks = find_apks()
@@ -535,26 +611,79 @@ def select_one_dex_from_list(dex_list):
 
 # ---------- Java/Smali text extraction ----------
 
+@functools.lru_cache(maxsize=8)
+def _printable_re(min_length):
+    """Compiled pattern for runs of at least min_length printable ASCII chars."""
+    return re.compile(r'[\x20-\x7E]{' + str(min_length) + r',}')
+
 def extract_strings_from_file(file_path, min_length=4):
     results = []
-    pattern = re.compile(r'[\x20-\x7E]{' + str(min_length) + r',}')
     try:
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            content = f.read()
-        for match in pattern.findall(content):
-            results.append((file_path, match))
+        # Only ASCII runs are kept, so skip UTF-8 validation: latin-1 maps bytes 1:1 in C,
+        # and every non-ASCII byte breaks a run
+        with open(file_path, "rb") as f:
+            content = f.read().decode("latin-1")
+        results = [(file_path, match) for match in _printable_re(min_length).findall(content)]
     except Exception as e:
         console.print(f"[yellow]⚠ Error processing file {file_path}: {e}[/]")
     return results
 
-def decompile_apk_to_java(apk_path):
+def _count_sources(sources_dir):
+    """Number of .java/.kt files under sources_dir (0 if it doesn't exist)."""
+    return sum(1 for _ in _find_files(sources_dir, (".java", ".kt"), prune=False))
+
+def _tail_lines(path, max_bytes=64 * 1024):
+    """Last lines of a text file, reading at most max_bytes from its end."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        f.seek(max(0, size - max_bytes))
+        return f.read().decode("utf-8", errors="replace").splitlines()
+
+def _completion_marker(sources_dir, format_type):
+    """Path of the marker written next to sources_dir once a decompilation finishes."""
+    return os.path.join(os.path.dirname(sources_dir), f".{format_type}.complete")
+
+def _mark_complete(sources_dir, format_type):
+    """Record that the java/smali decompilation in sources_dir ran to completion."""
+    with open(_completion_marker(sources_dir, format_type), "w"):
+        pass
+
+def _has_fresh_decompilation(apk_path, sources_dir, format_type):
+    """True if sources_dir holds a finished java/smali decompilation newer than the APK."""
+    # The marker is only written after JADX/apktool return normally, so a run that
+    # timed out, raised or was interrupted is never reused
+    try:
+        if os.path.getmtime(_completion_marker(sources_dir, format_type)) <= os.path.getmtime(apk_path):
+            return False
+    except OSError:
+        return False
+    # Guard against sources deleted by hand; stop at the first file found
+    if format_type == "smali":
+        return os.path.isfile(os.path.join(sources_dir, "apktool.yml"))
+    return next(_find_files(sources_dir, (".java", ".kt"), prune=False), None) is not None
+
+def _discard_dir(path):
+    """Rename path out of the way and delete it on a background thread."""
+    console.print(f"[blue]📂 Removing existing directory:[/] {path}")
+    trash = f"{path}.old-{os.getpid()}"
+    try:
+        os.rename(path, trash)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    # Non-daemon, so the delete still finishes if decompilation ends first
+    threading.Thread(target=shutil.rmtree, args=(trash, True)).start()
+
+def decompile_apk_to_java(apk_path, force=False):
     apk_name = os.path.basename(apk_path).replace(".apk", "")
     base_dir = os.path.join(OUTPUT_BASE_DIR, f"{apk_name}_EXTRACTION")
+    sources_dir = os.path.join(base_dir, "sources")
+    if not force and _has_fresh_decompilation(apk_path, sources_dir, "java"):
+        console.print(f"[dim]♻ Reusing existing decompilation (use --force to redo):[/dim] {sources_dir}")
+        return sources_dir, apk_name
     if os.path.exists(base_dir):
-        console.print(f"[blue]📂 Removing existing directory:[/] {base_dir}")
-        shutil.rmtree(base_dir, ignore_errors=True)
+        _discard_dir(base_dir)
     os.makedirs(base_dir, exist_ok=True)
-    sources_dir = os.path.join(base_dir, "sources")
     os.makedirs(sources_dir, exist_ok=True)
 
     console.print(f"[cyan]🛠 Decompiling APK to Java sources with JADX:[/]\n {apk_path}\n -> {sources_dir}")
@@ -574,95 +703,87 @@ def decompile_apk_to_java(apk_path):
         apk_path
     ]
     
+    # JADX can emit huge amounts of diagnostics: discard stdout and send stderr to a log file
+    # rather than buffering both in memory
+    stderr_log = os.path.join(base_dir, "jadx.stderr.log")
     try:
-        # Run JADX and capture output
-        result = subprocess.run(
-            jadx_flags,
-            check=False,  # Don't fail on non-zero exit
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout
-        )
+        with open(stderr_log, "wb") as errf:
+            result = subprocess.run(
+                jadx_flags,
+                check=False,  # Don't fail on non-zero exit
+                stdout=subprocess.DEVNULL,
+                stderr=errf,
+                timeout=600  # 10 minute timeout
+            )
         
         # Check if sources directory was created and has content
-        java_files = []
-        if os.path.exists(sources_dir):
-            for root, _, files in os.walk(sources_dir):
-                java_files.extend([f for f in files if f.endswith(('.java', '.kt'))])
-        
-        if java_files:
-            console.print(f"[green]✅ JADX extracted {len(java_files)} source files (despite possible errors)[/]")
+        source_count = _count_sources(sources_dir)
+        if source_count:
+            console.print(f"[green]✅ JADX extracted {source_count} source files (despite possible errors)[/]")
             if result.returncode != 0:
-                # Count errors from stderr
-                error_lines = [line for line in result.stderr.split('\n') if 'ERROR' in line.upper()]
-                if error_lines:
-                    console.print(f"[yellow]⚠ JADX reported {len(error_lines)} errors, but extraction continued.[/]")
+                # Count errors from stderr, streaming the log
+                with open(stderr_log, "rb") as errf:
+                    error_count = sum(1 for line in errf if b"ERROR" in line.upper())
+                if error_count:
+                    console.print(f"[yellow]⚠ JADX reported {error_count} errors, but extraction continued.[/]")
                     console.print("[yellow]   Some methods may be missing or incomplete, but available code will be extracted.[/]")
+            _mark_complete(sources_dir, "java")
         else:
             # No files extracted, this is a real failure
             console.print(f"[red]✖ JADX decompilation failed: No source files were extracted.[/]")
-            if result.stderr:
-                # Show last few error lines
-                error_lines = result.stderr.strip().split('\n')
+            # Show last few error lines
+            error_lines = [line for line in _tail_lines(stderr_log) if line.strip()]
+            if error_lines:
                 console.print("[red]Last errors:[/]")
                 for line in error_lines[-5:]:
-                    if line.strip():
-                        console.print(f"[red]  {line}[/]")
+                    console.print(f"[red]  {line}[/]")
             return None, None
             
     except subprocess.TimeoutExpired:
         console.print(f"[red]✖ JADX decompilation timed out after 10 minutes.[/]")
         # Check if we got partial results
-        java_files = []
-        if os.path.exists(sources_dir):
-            for root, _, files in os.walk(sources_dir):
-                java_files.extend([f for f in files if f.endswith(('.java', '.kt'))])
-        if java_files:
-            console.print(f"[yellow]⚠ Partial extraction: {len(java_files)} files were extracted before timeout.[/]")
+        source_count = _count_sources(sources_dir)
+        if source_count:
+            console.print(f"[yellow]⚠ Partial extraction: {source_count} files were extracted before timeout.[/]")
             console.print("[yellow]   Continuing with available sources...[/]")
         else:
             return None, None
     except Exception as e:
         console.print(f"[red]✖ JADX decompilation failed with exception: {e}[/]")
         # Check if we got partial results
-        java_files = []
-        if os.path.exists(sources_dir):
-            for root, _, files in os.walk(sources_dir):
-                java_files.extend([f for f in files if f.endswith(('.java', '.kt'))])
-        if java_files:
-            console.print(f"[yellow]⚠ Partial extraction: {len(java_files)} files were extracted despite error.[/]")
+        source_count = _count_sources(sources_dir)
+        if source_count:
+            console.print(f"[yellow]⚠ Partial extraction: {source_count} files were extracted despite error.[/]")
             console.print("[yellow]   Continuing with available sources...[/]")
         else:
             return None, None
     
     return sources_dir, apk_name
 
-def decompile_apk_to_smali(apk_path):
+def decompile_apk_to_smali(apk_path, force=False):
     apk_name = os.path.basename(apk_path).replace(".apk", "")
     base_dir = os.path.join(OUTPUT_BASE_DIR, f"{apk_name}_EXTRACTION")
+    sources_dir = os.path.join(base_dir, "sources")
+    if not force and _has_fresh_decompilation(apk_path, sources_dir, "smali"):
+        console.print(f"[dim]♻ Reusing existing decompilation (use --force to redo):[/dim] {sources_dir}")
+        return sources_dir, apk_name
     if os.path.exists(base_dir):
-        console.print(f"[blue]📂 Removing existing directory:[/] {base_dir}")
-        shutil.rmtree(base_dir, ignore_errors=True)
+        _discard_dir(base_dir)
     os.makedirs(base_dir, exist_ok=True)
-    sources_dir = os.path.join(base_dir, "sources")
 
     console.print(f"[cyan]🛠 Decompiling APK to smali sources with apktool:[/]\n {apk_path}\n -> {sources_dir}")
     try:
         subprocess.run(
             [APKTOOL_PATH, "d", apk_path, "-o", sources_dir, "-f"],
-            check=True
+            check=True,
+            stdout=subprocess.DEVNULL
         )
     except subprocess.CalledProcessError as e:
         console.print(f"[red]✖ apktool decompilation failed: {e}[/]")
         return None, None
+    _mark_complete(sources_dir, "smali")
     return sources_dir, apk_name
 
-def process_file(file_path, min_length, task, progress):
-    extracted = extract_strings_from_file(file_path, min_length=min_length)
-    with results_lock:
-        unique_results.update(extracted)
-    progress.update(task, advance=1)
-
 def process_directory(directory, min_length, format_type):
     if format_type == "java":
         include_exts = {
@@ -679,12 +800,7 @@ def process_directory(directory, min_length, format_type):
             ".aidl", ".mf", ".md"
         }
 
-    all_files = []
-    for root, _, files in os.walk(directory):
-        for file in files:
-            fp = os.path.join(root, file)
-            if os.path.splitext(file)[1].lower() in include_exts:
-                all_files.append(fp)
+    all_files = list(_find_files(directory, tuple(include_exts), prune=False))
 
     console.print(f"[magenta]📑 Extracting strings from:[/] {directory} ({len(all_files)} files)")
     if not all_files:
@@ -692,10 +808,15 @@ def process_directory(directory, min_length, format_type):
 
     with Progress() as progress:
         task = progress.add_task("[cyan]Extracting Strings...", total=len(all_files))
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            for file_path in all_files:
-                executor.submit(process_file, file_path, min_length, task, progress)
-    return sorted(unique_results, key=lambda x: (x[0], x[1]))
+        # Workers return their strings; dedup happens here, so no shared lock
+        unique_results = set()
+        n_workers = min(32, (os.cpu_count() or 4) * 4, len(all_files))
+        extract = functools.partial(extract_strings_from_file, min_length=min_length)
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            for extracted in executor.map(extract, all_files):
+                unique_results.update(extracted)
+                progress.update(task, advance=1)
+    return sorted(unique_results)
 
 
 # ---------- DEX parsing (single .dex selection, CSV only) ----------
@@ -711,30 +832,25 @@ def _read_uleb128(data: bytes, off: int):
         shift += 7
     return result, pos
 
-def _read_mutf8_cstring(data: bytes, off: int):
+def _decode_mutf8(raw: bytes) -> str:
     """
-    Read a MUTF-8 NUL-terminated string starting at off.
-    Convert common overlong 0xC0 0x80 to 0x00, decode via UTF-8 surrogatepass.
+    Decode non-ASCII MUTF-8: convert overlong 0xC0 0x80 to 0x00, decode via UTF-8 surrogatepass,
+    then join the surrogate pairs MUTF-8 uses for supplementary characters.
     """
-    buf = bytearray()
-    pos = off
-    while True:
-        b = data[pos]
-        pos += 1
-        if b == 0:
-            break
-        buf.append(b)
-    out = bytearray()
-    i = 0
-    while i < len(buf):
-        if i + 1 < len(buf) and buf[i] == 0xC0 and buf[i+1] == 0x80:
-            out.append(0x00)
-            i += 2
-        else:
-            out.append(buf[i])
-            i += 1
-    s = out.decode("utf-8", errors="surrogatepass")
-    return s, pos
+    s = raw.replace(b"\xc0\x80", b"\x00").decode("utf-8", errors="surrogatepass")
+    if s and max(s) >= "\ud800":
+        s = s.encode("utf-16-le", "surrogatepass").decode("utf-16-le", "surrogatepass")
+    return s
+
+def _read_mutf8_cstring(data: bytes, off: int):
+    """Read a MUTF-8 NUL-terminated string starting at off."""
+    end = data.find(b"\x00", off)
+    if end == -1:
+        raise ValueError("Unterminated string_data_item")
+    raw = data[off:end]
+    # Nearly all DEX strings are plain ASCII, which needs no rewriting
+    s = raw.decode("ascii") if raw.isascii() else _decode_mutf8(raw)
+    return s, end + 1
 
 def _iter_dex_files(dex_dir: str | None, glob_pat: str):
     import glob
@@ -743,10 +859,7 @@ def _iter_dex_files(dex_dir: str | None, glob_pat: str):
         candidates.extend(glob.glob(os.path.join(dex_dir, glob_pat)))
         # fallback to all dex if glob misses
         if not candidates:
-            for r, _, fs in os.walk(dex_dir):
-                for f in fs:
-                    if f.lower().endswith(".dex"):
-                        candidates.append(os.path.join(r, f))
+            candidates.extend(_find_files(dex_dir, ".dex", prune=False))
     else:
         candidates = find_dex_files()
         # refine with glob if provided
@@ -758,22 +871,12 @@ def _iter_dex_files(dex_dir: str | None, glob_pat: str):
             if refined:
                 candidates = refined
     # de-dup and sort
-    return sorted(set(os.path.normpath(p) for p in candidates if os.path.isfile(p)))
+    return sorted(dict.fromkeys(os.path.normpath(p) for p in candidates if os.path.isfile(p)))
 
 def _scan_one_dex(path: str, substr_filter: str | None, min_len: int):
     try:
-        data = Path(path).read_bytes()
-        entries = parse_dex_strings(data)  # returns tuples: (index, offset, string)
-        hits = []
-        for idx, off, s in entries:
-            if not s:
-                continue
-            if len(s) < min_len:
-                continue
-            if substr_filter is not None and substr_filter not in s:
-                continue
-            hits.append((path, idx, off, s))
-        return hits
+        entries = parse_dex_file(path, max(1, min_len), substr_filter)
+        return [(path, idx, off, s) for idx, off, s in entries]
     except Exception as e:
         return [(path, -1, 0, f"[ERROR] {e}")]
 
@@ -788,70 +891,99 @@ def dex_multi_mode_scan(dex_dir: str | None, glob_pat: str,
         return
     console.print(f"[magenta]📦 Scanning {len(dex_files)} dex files (pattern='{glob_pat}')...[/]")
 
-    results = []
-    with Progress() as progress:
+    # Rows are written as each file's hits arrive, so only one file's results are held at a time
+    total_matches = 0
+    with open(out_csv, "w", newline="", encoding="utf-8", errors="backslashreplace",
+              buffering=CSV_BUFFER_SIZE) as csvfile, Progress() as progress:
+        writer = csv.writer(csvfile)
+        writer.writerow(["dex_file", "index", "offset_hex", "string"])
         task = progress.add_task("[cyan]Parsing DEX strings...", total=len(dex_files))
-        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
-            futures = []
-            for p in dex_files:
-                futures.append(pool.submit(_scan_one_dex, p, substr_filter, min_len))
-            for fut in futures:
-                results.extend(fut.result())
+        # Parsing is CPU-bound Python, so use processes rather than GIL-bound threads
+        scan = functools.partial(_scan_one_dex, substr_filter=substr_filter, min_len=min_len)
+        total_size = sum(os.path.getsize(p) for p in dex_files)
+        serial = (jobs <= 1 or len(dex_files) <= DEX_SERIAL_MAX_FILES
+                  or total_size < DEX_SERIAL_MAX_BYTES)
+        with contextlib.ExitStack() as stack:
+            if serial:
+                results = map(scan, dex_files)
+            else:
+                pool = stack.enter_context(ProcessPoolExecutor(max_workers=jobs))
+                chunksize = max(1, len(dex_files) // (jobs * 4))
+                results = pool.map(scan, dex_files, chunksize=chunksize)
+            for hits in results:
+                writer.writerows(
+                    (path, idx, f"0x{off:08X}" if off >= 0 else "", s)
+                    for path, idx, off, s in hits
+                )
+                total_matches += len(hits)
                 progress.update(task, advance=1)
-
-    # write CSV
-    with open(out_csv, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=["dex_file", "index", "offset_hex", "string"])
-        writer.writeheader()
-        for path, idx, off, s in results:
-            writer.writerow({
-                "dex_file": path,
-                "index": idx,
-                "offset_hex": f"0x{off:08X}" if isinstance(off, int) and off >= 0 else "",
-                "string": s
-            })
     console.print(f"[green]✅ Multi-dex strings saved to:[/] {out_csv}")
-    console.print(f"[cyan]📊 Total matches:[/] {len(results)}")
+    console.print(f"[cyan]📊 Total matches:[/] {total_matches}")
 
 
-def parse_dex_strings(dex_bytes: bytes):
+def parse_dex_strings(dex_bytes: bytes, min_len: int = 0, substr_filter: str | None = None):
     """
     Return list of (string_index, string_data_offset, string) per AOSP dex spec:
     string_ids_size @ 0x38, string_ids_off @ 0x3C; each id -> string_data_item (uleb128 len + MUTF-8 + NUL).
+    Strings shorter than min_len or not containing substr_filter are dropped.
     """
     if len(dex_bytes) < 0x40:
         raise ValueError("Not a valid DEX (too small)")
-    string_ids_size = int.from_bytes(dex_bytes[0x38:0x3C], "little")
-    string_ids_off  = int.from_bytes(dex_bytes[0x3C:0x40], "little")
+    string_ids_size, string_ids_off = struct.unpack_from("<II", dex_bytes, 0x38)
     end = string_ids_off + string_ids_size * 4
     if end > len(dex_bytes):
         raise ValueError("Corrupt DEX string_ids")
 
+    # Decode the whole string_ids table in one C call
+    sdata_offs = struct.unpack_from(f"<{string_ids_size}I", dex_bytes, string_ids_off)
+    size = len(dex_bytes)
+    find = dex_bytes.find
+    # An ASCII filter matches the same way on the raw MUTF-8 bytes, so rejects skip the decode
+    raw_filter = None
+    if substr_filter and substr_filter.isascii() and "\x00" not in substr_filter:
+        raw_filter = substr_filter.encode("ascii")
     results = []
-    for i in range(string_ids_size):
-        sdata_off = int.from_bytes(
-            dex_bytes[string_ids_off + i*4:string_ids_off + (i+1)*4],
-            "little"
-        )
-        if sdata_off <= 0 or sdata_off >= len(dex_bytes):
+    append = results.append
+    for i, sdata_off in enumerate(sdata_offs):
+        if sdata_off <= 0 or sdata_off >= size:
             continue
         try:
-            _utf16_len, p = _read_uleb128(dex_bytes, sdata_off)
-            s, _np = _read_mutf8_cstring(dex_bytes, p)
+            # Inlined _read_uleb128 (value unused) + _read_mutf8_cstring:
+            # per-string call overhead dominates once the scans are C-level
+            p = sdata_off
+            while dex_bytes[p] & 0x80:
+                p += 1
+            p += 1
+            q = find(b"\x00", p)
+            if q == -1:
+                raise ValueError("Unterminated string_data_item")
+            raw = dex_bytes[p:q]
+            # Decoded length never exceeds the byte length
+            if len(raw) < min_len:
+                continue
+            if raw_filter is not None and raw_filter not in raw:
+                continue
+            s = raw.decode("ascii") if raw.isascii() else _decode_mutf8(raw)
         except Exception:
             try:
                 _utf16_len, p = _read_uleb128(dex_bytes, sdata_off)
                 # fallback raw until NUL
-                q = p
-                raw = bytearray()
-                while q < len(dex_bytes) and dex_bytes[q] != 0:
-                    raw.append(dex_bytes[q]); q += 1
-                s = raw.decode("latin1", errors="replace")
+                q = dex_bytes.find(b"\x00", p)
+                s = dex_bytes[p:q if q != -1 else size].decode("latin1", errors="replace")
             except Exception:
                 s = "<decode_error>"
-        results.append((i, sdata_off, s))
+        if len(s) < min_len:
+            continue
+        if substr_filter is not None and substr_filter not in s:
+            continue
+        append((i, sdata_off, s))
     return results
 
+def parse_dex_file(path: str, min_len: int = 0, substr_filter: str | None = None):
+    """parse_dex_strings on a memory-mapped DEX, so the file is never copied onto the heap."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return parse_dex_strings(mm, min_len, substr_filter)
+
 def dex_mode_select_and_write_csv():
     """
     List ONLY .dex files, let user select one, parse strings, and write CSV next to the file.
@@ -867,8 +999,7 @@ def dex_mode_select_and_write_csv():
 
     console.print(f"\n[cyan]🔎 Parsing DEX strings from:[/] {dex_path}")
     try:
-        data = Path(dex_path).read_bytes()
-        entries = parse_dex_strings(data)
+        entries = parse_dex_file(dex_path)
     except Exception as e:
         console.print(f"[red]✖ Failed to parse DEX: {e}[/]")
         return
@@ -879,15 +1010,11 @@ def dex_mode_select_and_write_csv():
     out_csv = os.path.join(out_dir, f"{Path(dex_path).stem}_strings.csv")
 
     try:
-        with open(out_csv, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=["index", "offset_hex", "string"])
-            writer.writeheader()
-            for idx, off, s in entries:
-                writer.writerow({
-                    "index": idx,
-                    "offset_hex": f"0x{off:08X}",
-                    "string": s
-                })
+        with open(out_csv, "w", newline="", encoding="utf-8", errors="backslashreplace",
+                  buffering=CSV_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(["index", "offset_hex", "string"])
+            writer.writerows((idx, f"0x{off:08X}", s) for idx, off, s in entries)
         console.print(f"[green]✅ DEX strings saved to:[/] {out_csv}")
         console.print(f"[cyan]📊 Total strings extracted:[/] {len(entries)}")
     except Exception as e:
@@ -902,6 +1029,8 @@ def main():
     )
     parser.add_argument("input", nargs="?", help="APK file or directory (optional for java/smali; ignored for dex modes)")
     parser.add_argument("-m", "--min-length", type=int, default=4, help="Minimum string length to extract (default: 4)")
+    parser.add_argument("--force", action="store_true",
+                        help="Decompile again even if an up-to-date java/smali decompilation exists")
     parser.add_argument(
         "-f", "--format",
         choices=["java", "smali", "dex", "dex-multi"],
@@ -948,14 +1077,10 @@ def main():
         console.print(f"[red]✖ Error: {input_path} does not exist.[/]")
         return
 
-    # Reset unique results for this run
-    global unique_results
-    unique_results = set()
-
     # If an APK is provided, decompile accordingly
     if input_path.lower().endswith(".apk"):
         if format_type == "java":
-            target_dir, apk_name = decompile_apk_to_java(input_path)
+            target_dir, apk_name = decompile_apk_to_java(input_path, force=args.force)
             if not target_dir:
                 console.print("\n[yellow]⚠ JADX (Java) decompilation failed completely.[/]")
                 console.print("[cyan]💡 Suggestion: Try using 'smali' format instead, which is more reliable for complex apps.[/]")
@@ -963,7 +1088,7 @@ def main():
                 console.print("[red]✖ Exiting...[/]")
                 return
         elif format_type == "smali":
-            target_dir, apk_name = decompile_apk_to_smali(input_path)
+            target_dir, apk_name = decompile_apk_to_smali(input_path, force=args.force)
         else:
             console.print("[red]✖ Invalid format specified.[/]")
             return
@@ -991,11 +1116,10 @@ def main():
     output_file = os.path.join(base_dir, csv_filename)
 
     try:
-        with open(output_file, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=["file", "string"])
-            writer.writeheader()
-            for file_path, string in extracted_strings:
-                writer.writerow({"file": file_path, "string": string})
+        with open(output_file, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(["file", "string"])
+            writer.writerows(extracted_strings)
         console.print(f"\n[green]✅ Extracted strings saved to:[/] {output_file}")
         console.print(f"[cyan]📊 Total unique strings extracted:[/] {len(extracted_strings)}")
     except Exception as e:
@@ -6,13 +6,21 @@
 # Android Backup Extractor - Extracts and decompresses Android .ab backups
 # ---------------------------------------------------------------------------
 
+import functools
+import mmap
 import os
+import queue
+import re
+import shutil
+import subprocess
 import sys
-import struct
+import threading
 import tarfile
 import zlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from rich.console import Console
 from rich.table import Table
@@ -21,6 +29,13 @@ from prompt_toolkit.completion import Completer, Completion, FuzzyCompleter
 from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.validation import Validator, ValidationError
 
+# Optional ISA-L (SIMD) inflate with the same decompressobj API as zlib
+try:
+    from isal import isal_zlib
+    HAS_ISAL = True
+except ImportError:
+    HAS_ISAL = False
+
 console = Console()
 
 
@@ -38,17 +53,43 @@ def get_toolkit_root() -> Path:
 TOOLKIT_ROOT = get_toolkit_root()
 OUTPUT_BASE = TOOLKIT_ROOT / "src" / "output"
 
+AB_MAGIC = b"ANDROID BACKUP\n"
+
+# Compressed payload bytes handed to zlib per call, and the tar output buffer size
+INFLATE_CHUNK = 1 << 20
+TAR_WRITE_BUFFER = 1 << 20
+# Inflated chunks allowed in flight between the inflate thread and the writer
+INFLATE_QUEUE_DEPTH = 8
+# extract_tar: regular files up to this size are written by a thread pool; the rest go through tarfile
+EXTRACT_WORKERS = 16
+EXTRACT_POOL_MAX_MEMBER = 4 * 1024 * 1024
+# select_ab_file: rows rendered in the table; the rest are reachable by number or fuzzy search
+TABLE_MAX_ROWS = 20
+# classify_ab_files: header reads in flight (overlaps open() latency on slow mounts)
+HEADER_PROBE_WORKERS = 16
+
 
 # =============================================================================
 # Selection Menu (same style as Open In Jadx)
 # =============================================================================
 
+@functools.lru_cache(maxsize=64)
+def _fuzzy_re(pattern: str) -> "re.Pattern[str]":
+    """
+    Compiled subsequence matcher: `[^a]*a[^b]*b...` matches iff pattern's chars occur in order.
+    Each class excludes its next char, so matching is linear with no backtracking.
+    """
+    return re.compile("".join(f"[^{re.escape(ch)}]*{re.escape(ch)}" for ch in pattern), re.DOTALL)
+
+
 class FileCompleter(Completer):
     """Completer for file selection with fuzzy matching."""
     
-    def __init__(self, file_paths: List[str]):
+    def __init__(self, file_paths: List[str], filenames: Optional[List[str]] = None):
         self.file_paths = file_paths
-        self.filenames = [os.path.basename(p) for p in file_paths]
+        self.filenames = filenames if filenames is not None else [os.path.basename(p) for p in file_paths]
+        # Lowercased once here rather than per name on every keystroke
+        self.filenames_lower = [n.lower() for n in self.filenames]
 
     def get_completions(self, document, complete_event):
         text = document.text.strip()
@@ -67,21 +108,17 @@ class FileCompleter(Completer):
         # Fuzzy filter by filename
         lower = text.lower()
         matches = []
-        for name in self.filenames:
-            if not text or self._fuzzy_match(lower, name.lower()):
-                matches.append(name)
+        for name, name_l in zip(self.filenames, self.filenames_lower):
+            if not text or self._fuzzy_match(lower, name_l):
+                matches.append((not name_l.startswith(lower), len(name), name_l, name))
         
-        matches.sort(key=lambda n: (not n.lower().startswith(lower), len(n), n.lower()))
-        for name in matches:
+        matches.sort(key=lambda m: m[:3])
+        for *_, name in matches:
             yield Completion(name, start_position=-len(text), display=name)
 
     @staticmethod
     def _fuzzy_match(pattern: str, text: str) -> bool:
-        i = 0
-        for ch in text:
-            if i < len(pattern) and ch == pattern[i]:
-                i += 1
-        return i == len(pattern)
+        return _fuzzy_re(pattern).match(text) is not None
 
 
 class NumberOrNameValidator(Validator):
@@ -107,6 +144,37 @@ class NumberOrNameValidator(Validator):
 # Core Functions
 # =============================================================================
 
+def _iter_ab_files(root: str):
+    """Yield .ab files under root via scandir, whose cached entry types avoid a stat per file."""
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                # Like os.walk, don't descend into symlinked directories
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith(".ab") and entry.is_file():
+                    yield entry.path
+
+
+def _is_walked_by(root: Path, parent: Path) -> bool:
+    """True if walking parent already reaches root (nested, with no symlinked step)."""
+    try:
+        rel = root.relative_to(parent)
+    except ValueError:
+        return False
+    sub = parent
+    for part in rel.parts:
+        sub = sub / part
+        if sub.is_symlink():
+            return False
+    return True
+
+
 def find_ab_files() -> List[str]:
     """Searches for .ab files in the toolkit directories."""
     search_paths = [
@@ -121,19 +189,23 @@ def find_ab_files() -> List[str]:
     if docker_data.exists():
         search_paths.append(docker_data)
     
-    ab_files = []
-
+    # The roots nest inside TOOLKIT_ROOT; walk each tree once
+    roots = []
     for search_path in search_paths:
-        if not search_path.exists():
-            continue
-        # Search recursively
-        for root, _, files in os.walk(str(search_path)):
-            for file in files:
-                if file.lower().endswith(".ab"):
-                    ab_files.append(os.path.join(root, file))
+        if search_path.is_dir() and not any(_is_walked_by(search_path, r) for r in roots):
+            roots.append(search_path)
+
+    # Walks are I/O-latency bound (the Docker data dir may be a slow mount), so run them
+    # concurrently; the total is then the slowest root rather than the sum
+    if len(roots) > 1:
+        with ThreadPoolExecutor(max_workers=len(roots)) as pool:
+            per_root = list(pool.map(lambda r: list(_iter_ab_files(str(r))), roots))
+    else:
+        per_root = [_iter_ab_files(str(r)) for r in roots]
 
-    # De-duplicate and sort
-    return sorted(set(ab_files))
+    # De-duplicate (symlinked roots can repeat a file) and sort
+    ab_files = dict.fromkeys(p for found in per_root for p in found)
+    return sorted(ab_files)
 
 
 def select_ab_file(ab_files: List[str]) -> str:
@@ -151,13 +223,16 @@ def select_ab_file(ab_files: List[str]) -> str:
     table.add_column('Backup Name', style='green', min_width=20)
     table.add_column('Full Path', style='dim', overflow='ellipsis')
 
-    for i, ab_path in enumerate(ab_files, 1):
-        name = os.path.basename(ab_path)
+    # Basenames computed once and shared by the table, completer, validator and resolver
+    names = [os.path.basename(p) for p in ab_files]
+    for i, (ab_path, name) in enumerate(zip(ab_files[:TABLE_MAX_ROWS], names), 1):
         table.add_row(str(i), name, ab_path)
     console.print(table)
+    if len(ab_files) > TABLE_MAX_ROWS:
+        console.print(f"[dim]... and {len(ab_files) - TABLE_MAX_ROWS} more (#{TABLE_MAX_ROWS + 1}-{len(ab_files)}), start typing to filter[/dim]")
 
-    names = [os.path.basename(p) for p in ab_files]
-    completer = FuzzyCompleter(FileCompleter(ab_files))
+    file_completer = FileCompleter(ab_files, names)
+    completer = FuzzyCompleter(file_completer)
     validator = NumberOrNameValidator(len(ab_files), names)
 
     console.print("\n[cyan]💡 You can either:[/cyan]")
@@ -184,20 +259,12 @@ def select_ab_file(ab_files: List[str]) -> str:
     else:
         # Find best fuzzy match
         lower = answer.lower()
+        fuzzy = _fuzzy_re(lower)
         best = None
         best_key = (True, 10**9, '')
         
-        for p in ab_files:
-            name = os.path.basename(p)
-            name_l = name.lower()
-            
-            # Check fuzzy match
-            i = 0
-            for ch in name_l:
-                if i < len(lower) and ch == lower[i]:
-                    i += 1
-            
-            if i == len(lower):  # Fuzzy match found
+        for p, name, name_l in zip(ab_files, names, file_completer.filenames_lower):
+            if fuzzy.match(name_l):  # Fuzzy match found
                 key = (not name_l.startswith(lower), len(name), name_l)
                 if key < best_key:
                     best_key = key
@@ -206,14 +273,113 @@ def select_ab_file(ab_files: List[str]) -> str:
         return best if best else ab_files[0]
 
 
+def _read_ab_header(f) -> Optional[tuple]:
+    """
+    Read the four header lines (magic, format version, compression flag, encryption) from an open
+    backup. Returns (version, compressed, encryption, payload_offset), or None if it isn't a backup.
+    """
+    if f.readline(len(AB_MAGIC)) != AB_MAGIC:
+        return None
+    version = f.readline(32).strip()
+    compressed = f.readline(32).strip() == b"1"
+    encryption = f.readline(64).strip()
+    if not version.isdigit():
+        return None
+    return int(version), compressed, encryption.decode(errors="replace"), f.tell()
+
+
+def parse_ab_header(file_path: str) -> Optional[tuple]:
+    """Parse a backup's header; see _read_ab_header."""
+    try:
+        with open(file_path, "rb") as f:
+            return _read_ab_header(f)
+    except OSError:
+        return None
+
+
 def is_android_backup(file_path: str) -> bool:
     """Checks if a file is a valid Android backup."""
+    return parse_ab_header(file_path) is not None
+
+
+def classify_ab_files(ab_files: List[str]) -> List[str]:
+    """Keep the files that have a valid backup header, probing them concurrently."""
+    if len(ab_files) > 1:
+        with ThreadPoolExecutor(max_workers=min(HEADER_PROBE_WORKERS, len(ab_files))) as pool:
+            valid = list(pool.map(is_android_backup, ab_files))
+    else:
+        valid = [is_android_backup(p) for p in ab_files]
+    return [p for p, ok in zip(ab_files, valid) if ok]
+
+
+def _inflate_chunks(view: memoryview, start: int, chunks: queue.Queue, stop: threading.Event) -> None:
+    """Inflate view[start:] into chunks, always ending with None. Runs on a worker thread."""
     try:
-        with open(file_path, "rb") as f:
-            header = f.read(15)
-            return header.startswith(b"ANDROID BACKUP")
-    except Exception:
-        return False
+        decompressor = (isal_zlib if HAS_ISAL else zlib).decompressobj()
+        for off in range(start, len(view), INFLATE_CHUNK):
+            if stop.is_set():
+                return
+            # Cap each call's output so a highly compressed slice can't balloon into one huge bytes
+            out = decompressor.decompress(view[off:off + INFLATE_CHUNK], INFLATE_CHUNK)
+            while True:
+                if out:
+                    chunks.put(out)
+                if not decompressor.unconsumed_tail or stop.is_set():
+                    break
+                out = decompressor.decompress(decompressor.unconsumed_tail, INFLATE_CHUNK)
+        chunks.put(decompressor.flush())
+    finally:
+        chunks.put(None)
+
+
+def inflate_payload(ab_file, tar_file) -> None:
+    """
+    Inflate the zlib payload after the header into tar_file. zlib releases the GIL, so inflating
+    on a worker thread overlaps with the disk writes done here.
+    """
+    start = ab_file.tell()
+    if os.fstat(ab_file.fileno()).st_size <= start:
+        return
+    chunks = queue.Queue(maxsize=INFLATE_QUEUE_DEPTH)
+    stop = threading.Event()
+    # Feed zlib zero-copy views of the mapped payload instead of read() copies
+    with mmap.mmap(ab_file.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+            memoryview(mm) as view, ThreadPoolExecutor(max_workers=1) as pool:
+        inflater = pool.submit(_inflate_chunks, view, start, chunks, stop)
+        try:
+            while True:
+                out = chunks.get()
+                if out is None:
+                    break
+                tar_file.write(out)
+        finally:
+            # If the writer failed, drain so a blocked put() returns and the inflater exits
+            stop.set()
+            while not inflater.done():
+                try:
+                    chunks.get(timeout=0.05)
+                except queue.Empty:
+                    pass
+        inflater.result()  # Re-raise any zlib error
+
+
+def copy_payload(ab_file, tar_file) -> None:
+    """Copy the uncompressed tar after the header without loading it into memory."""
+    offset = ab_file.tell()
+    remaining = os.fstat(ab_file.fileno()).st_size - offset
+    tar_file.flush()
+    try:
+        # In-kernel copy on Linux
+        while remaining > 0:
+            sent = os.sendfile(tar_file.fileno(), ab_file.fileno(), offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+    except (AttributeError, OSError):
+        # No sendfile between regular files on this platform: stream what is left
+        ab_file.seek(offset)
+        shutil.copyfileobj(ab_file, tar_file, TAR_WRITE_BUFFER)
 
 
 def convert_ab_to_tar(input_ab: str, output_tar: str) -> None:
@@ -221,40 +387,97 @@ def convert_ab_to_tar(input_ab: str, output_tar: str) -> None:
     console.print(f"[cyan]📦 Converting {os.path.basename(input_ab)} to tar...[/cyan]")
 
     with open(input_ab, "rb") as ab_file:
-        header = ab_file.read(24)  # Read first 24 bytes
-        magic, version, compressed = struct.unpack(">14sH?", header[:17])
-
-        if magic != b"ANDROID BACKUP":
+        header = _read_ab_header(ab_file)
+        if header is None:
             console.print("[red]❌ Error: Not a valid Android backup file![/red]")
             sys.exit(1)
+        version, compressed, encryption, _ = header
+        if encryption != "none":
+            console.print(f"[red]❌ Error: Encrypted backups ({encryption}) are not supported![/red]")
+            sys.exit(1)
 
         console.print(f"[dim]Backup version: {version}, Compressed: {'Yes' if compressed else 'No'}[/dim]")
 
-        with open(output_tar, "wb") as tar_file:
+        with open(output_tar, "wb", buffering=TAR_WRITE_BUFFER) as tar_file:
             if compressed:
                 console.print("[cyan]🔓 Decompressing backup...[/cyan]")
-                decompressor = zlib.decompressobj()
-                while True:
-                    chunk = ab_file.read(4096)
-                    if not chunk:
-                        break
-                    tar_file.write(decompressor.decompress(chunk))
-                tar_file.write(decompressor.flush())
+                inflate_payload(ab_file, tar_file)
             else:
                 console.print("[cyan]📄 Extracting raw tar data...[/cyan]")
-                tar_file.write(ab_file.read())
+                copy_payload(ab_file, tar_file)
 
     console.print(f"[green]✅ Converted to: {output_tar}[/green]")
 
 
+def _write_member(tar: tarfile.TarFile, member: tarfile.TarInfo, target: str, data: bytes) -> None:
+    """Write one regular tar member and apply its owner/mode/mtime like tarfile would."""
+    with open(target, "wb") as f:
+        f.write(data)
+    tar.chown(member, target, False)
+    tar.chmod(member, target)
+    tar.utime(member, target)
+
+
+def _extract_tar_native(tar_bin: str, tar_file: str, output_dir: str) -> bool:
+    """Extract with the system tar binary; returns False if it failed."""
+    result = subprocess.run(
+        [tar_bin, "-xf", tar_file, "-C", output_dir, "--no-same-owner"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, errors="replace",
+    )
+    if result.returncode == 0:
+        return True
+    error = result.stderr.strip().splitlines()[:1] or [f"exit code {result.returncode}"]
+    console.print(f"[yellow]⚠️ {os.path.basename(tar_bin)} failed ({error[0]}), retrying with tarfile...[/yellow]")
+    return False
+
+
+def _extract_tar_python(tar_file: str, output_dir: str) -> None:
+    """Extract with tarfile, writing small members from a thread pool."""
+    # 1 MiB copy buffer instead of tarfile's 16 KiB for large members (APKs, databases)
+    with tarfile.open(tar_file, "r", copybufsize=TAR_WRITE_BUFFER) as tar:
+        members = tar.getmembers()
+        name_counts = Counter(m.name for m in members)
+        deferred = []
+        made_dirs = set()
+        # Bound the member bodies held in memory while waiting for a writer
+        slots = threading.BoundedSemaphore(EXTRACT_WORKERS * 4)
+        with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as pool:
+            futures = []
+            for member in members:
+                rel = os.path.normpath(member.name)
+                # Only plain, uniquely named, small files inside output_dir take the parallel path;
+                # anything else keeps tarfile's own handling below
+                if (not member.isreg() or member.size > EXTRACT_POOL_MAX_MEMBER
+                        or name_counts[member.name] > 1 or os.path.isabs(rel)
+                        or rel == os.pardir or rel.startswith(os.pardir + os.sep)):
+                    deferred.append(member)
+                    continue
+                target = os.path.join(output_dir, rel)
+                parent = os.path.dirname(target)
+                if parent not in made_dirs:
+                    os.makedirs(parent, exist_ok=True)
+                    made_dirs.add(parent)
+                data = tar.extractfile(member).read()
+                slots.acquire()
+                future = pool.submit(_write_member, tar, member, target, data)
+                future.add_done_callback(lambda _: slots.release())
+                futures.append(future)
+            for future in futures:
+                future.result()
+        # Directories (attributes applied last, as extractall does), links, large files, duplicates
+        tar.extractall(path=output_dir, members=deferred)
+
+
 def extract_tar(tar_file: str, output_dir: str) -> None:
     """Extracts a tar archive."""
     console.print(f"[cyan]📂 Extracting to {output_dir}...[/cyan]")
 
     os.makedirs(output_dir, exist_ok=True)
 
-    with tarfile.open(tar_file, "r") as tar:
-        tar.extractall(path=output_dir)
+    # GNU/BSD tar walks the headers in C; tarfile is the fallback when it is missing or fails
+    tar_bin = shutil.which("tar")
+    if not tar_bin or not _extract_tar_native(tar_bin, tar_file, output_dir):
+        _extract_tar_python(tar_file, output_dir)
 
     console.print(f"[green]✅ Extracted to: {output_dir}[/green]")
 
@@ -277,7 +500,10 @@ def main():
 
     # Find .ab files
     console.print("[cyan]🔍 Scanning for Android backup files...[/cyan]")
-    ab_files = find_ab_files()
+    found = find_ab_files()
+    ab_files = classify_ab_files(found)
+    if len(ab_files) < len(found):
+        console.print(f"[yellow]⚠️ Skipped {len(found) - len(ab_files)} .ab file(s) without an Android backup header[/yellow]")
 
     if not ab_files:
         console.print("[red]❌ No Android backup (.ab) files found![/red]")
@@ -295,11 +521,6 @@ def main():
     console.print(f"\n[green]🎯 Selected:[/green] {os.path.basename(backup_ab)}")
     console.print(f"[dim]Path: {backup_ab}[/dim]")
 
-    # Verify it's a valid backup
-    if not is_android_backup(backup_ab):
-        console.print("[red]❌ Error: Not a valid Android backup file![/red]")
-        sys.exit(1)
-
     # Define output locations
     OUTPUT_BASE.mkdir(parents=True, exist_ok=True)
     tar_file = str(OUTPUT_BASE / f"{backup_filename}.tar")
@@ -5,7 +5,9 @@
 # with an option to clean up leftover artifacts at the end.
 # ---------------------------------------------------------------------------
 
+import functools
 import os
+import re
 import sys
 import subprocess
 import shutil
@@ -92,6 +94,14 @@ def ensure_keystore():
 # ---------------------------------------------------------------------------
 # Finds valid Android "projects" in src/output (apktool-decompiled)
 # ---------------------------------------------------------------------------
+def _list_names(folder_path):
+    """Names of the entries in folder_path (empty if it can't be listed)."""
+    try:
+        with os.scandir(folder_path) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
 def find_android_projects():
     valid_projects = []
     jadx_projects = []
@@ -100,30 +110,25 @@ def find_android_projects():
         console.print(f"[red]❌ Output directory '{OUTPUT_DIR}' does not exist.[/]")
         return []
 
-    for folder in os.listdir(OUTPUT_DIR):
-        folder_path = os.path.join(OUTPUT_DIR, folder)
+    # One directory listing per folder instead of an exists() probe per marker
+    with os.scandir(OUTPUT_DIR) as it:
+        folders = [entry.path for entry in it if entry.is_dir()]
 
-        if not os.path.isdir(folder_path):
-            continue
+    for folder_path in folders:
+        entries = _list_names(folder_path)
 
         # Check for apktool-style decompilation (can be rebuilt)
-        manifest_path = os.path.join(folder_path, "AndroidManifest.xml")
-        smali_folder = os.path.join(folder_path, "smali")
-        dex_file = os.path.join(folder_path, "classes.dex")
-
-        if os.path.exists(manifest_path) and (os.path.exists(smali_folder) or os.path.exists(dex_file)):
+        if "AndroidManifest.xml" in entries and ("smali" in entries or "classes.dex" in entries):
             valid_projects.append(folder_path)
             continue
 
         # Check for JADX-style decompilation (Java source - cannot be rebuilt)
-        sources_folder = os.path.join(folder_path, "sources")
-        resources_folder = os.path.join(folder_path, "resources")
-        # Also check nested structure: folder/sources/sources and folder/sources/resources
-        nested_sources = os.path.join(folder_path, "sources", "sources")
-        nested_resources = os.path.join(folder_path, "sources", "resources")
-        
-        if (os.path.exists(sources_folder) and os.path.exists(resources_folder)) or \
-           (os.path.exists(nested_sources) and os.path.exists(nested_resources)):
+        if "sources" not in entries:
+            continue
+        if "resources" not in entries:
+            # Also check nested structure: folder/sources/sources and folder/sources/resources
+            entries = _list_names(os.path.join(folder_path, "sources"))
+        if "sources" in entries and "resources" in entries:
             jadx_projects.append(folder_path)
 
     # Warn about JADX projects
@@ -164,9 +169,11 @@ def find_apk_files():
 # Let user pick one of the valid projects or APKs
 # ---------------------------------------------------------------------------
 class ProjectAPKCompleter(Completer):
-    def __init__(self, choices):
+    def __init__(self, choices, names=None):
         self.choices = choices
-        self.names = [os.path.basename(path) for typ, path in choices]
+        self.names = names if names is not None else [os.path.basename(path) for typ, path in choices]
+        # Lowercased once here rather than per name on every keystroke
+        self.names_lower = [name.lower() for name in self.names]
     def get_completions(self, document, complete_event):
         text = document.text.strip()
         if text.isdigit():
@@ -177,19 +184,21 @@ class ProjectAPKCompleter(Completer):
             return
         lower = text.lower()
         matches = []
-        for name in self.names:
-            if not text or fuzzy_match(lower, name.lower()):
-                matches.append(name)
-        matches.sort(key=lambda n: (not n.lower().startswith(lower), len(n), n.lower()))
-        for name in matches:
+        for name, name_l in zip(self.names, self.names_lower):
+            if not text or fuzzy_match(lower, name_l):
+                matches.append((name, name_l))
+        matches.sort(key=lambda m: (not m[1].startswith(lower), len(m[0]), m[1]))
+        for name, _ in matches:
             yield Completion(name, start_position=-len(text), display=name)
 
+@functools.lru_cache(maxsize=64)
+def _fuzzy_re(pattern):
+    """Compiled subsequence matcher: `[^a]*a[^b]*b...` matches iff pattern's chars occur in order."""
+    return re.compile("".join(f"[^{re.escape(ch)}]*{re.escape(ch)}" for ch in pattern), re.DOTALL)
+
 def fuzzy_match(pattern, text):
-    i = 0
-    for ch in text:
-        if i<len(pattern) and ch == pattern[i]:
-            i+=1
-    return i==len(pattern)
+    # Substring (the usual case while typing) via str's C search, else one regex match
+    return pattern in text or _fuzzy_re(pattern).match(text) is not None
 
 class NumberOrNameValidator(Validator):
     def __init__(self, count, names):
@@ -222,7 +231,8 @@ def select_project_or_apk(projects, apks):
         choices.append(("apk", apk))
     console.print(table)
     names = [os.path.basename(path) for typ, path in choices]
-    completer = FuzzyCompleter(ProjectAPKCompleter(choices))
+    project_completer = ProjectAPKCompleter(choices, names)
+    completer = FuzzyCompleter(project_completer)
     validator = NumberOrNameValidator(len(choices), names)
     answer = pt_prompt(
         HTML("Enter # or start typing name: "),
@@ -237,13 +247,12 @@ def select_project_or_apk(projects, apks):
     lower = answer.lower()
     best = None
     best_key = (True, 10**9, '')
-    for typ, path in choices:
-        name_l = os.path.basename(path).lower()
+    for choice, name_l in zip(choices, project_completer.names_lower):
         if fuzzy_match(lower, name_l):
             key = (not name_l.startswith(lower), len(name_l), name_l)
             if key < best_key:
                 best_key = key
-                best = (typ, path)
+                best = choice
     return best if best else choices[0]
 
 # ---------------------------------------------------------------------------
@@ -338,7 +347,20 @@ def prompt_cleanup(unsigned_apk, signed_apk):
 # ---------------------------------------------------------------------------
 # List connected devices using adb
 # ---------------------------------------------------------------------------
+_adb_server = None  # Background `adb start-server`, see start_adb_server()
+
+def start_adb_server():
+    """Start the adb daemon in the background so its startup overlaps the menu and the build."""
+    global _adb_server
+    try:
+        _adb_server = subprocess.Popen([ADB_PATH, "start-server"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError:
+        _adb_server = None
+
 def list_devices():
+    # Two clients racing to spawn the daemon can fail, so let the warm-up finish first
+    if _adb_server is not None:
+        _adb_server.wait()
     try:
         result = subprocess.run([ADB_PATH, "devices"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True)
     except subprocess.CalledProcessError as e:
@@ -424,6 +446,7 @@ def main():
         console.print("  • Or place APK files in [cyan]src/output/pulled_apks/[/cyan] to install them")
         return
 
+    start_adb_server()
     selection_type, selection = select_project_or_apk(projects, apks)
 
     if selection_type == "project":
@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 # MRET: no_args
 import argparse
+import atexit
+import bisect
+import functools
+import heapq
 import subprocess
 import os
+import shlex
 import shutil
 import zipfile
 from pathlib import Path
@@ -19,6 +24,14 @@ from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.validation import Validator, ValidationError
 
+# Optional C implementation of the fuzzy (subsequence) match
+try:
+    from rapidfuzz import process as rf_process
+    from rapidfuzz.distance import LCSseq
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
 console = Console()
 
 # Resolve OUTPUT_DIR relative to the Mobile-RE-Toolkit root
@@ -49,6 +62,15 @@ def get_output_dir() -> str:
 
 OUTPUT_DIR = get_output_dir()
 
+# merge_split_apks_manual: chunk size for streaming entries between zips
+ZIP_COPY_BUFFER = 1 << 20
+# pull_apks: concurrent `adb pull` processes for split APKs
+PULL_WORKERS = 4
+# list_packages: known system package prefixes, dropped when filter_system is set
+SYSTEM_PACKAGE_PREFIXES = ("com.google", "com.android", "androidx", "com.qualcomm", "com.samsung", "android", "com.oplus", "net.oneplus", "com.oneplus", "oplus")
+# Same prefixes as they appear in raw `pm list packages` lines
+SYSTEM_PACKAGE_LINE_PREFIXES = tuple("package:" + prefix for prefix in SYSTEM_PACKAGE_PREFIXES)
+
 def calculate_match_score(query: str, text: str) -> Tuple[int, int, int, str]:
     """
     Calculate match score for ranking completions.
@@ -62,36 +84,110 @@ def calculate_match_score(query: str, text: str) -> Tuple[int, int, int, str]:
     3 = Fuzzy match (chars in order)
     4 = No match
     """
-    query_lower = query.lower()
-    text_lower = text.lower()
+    return match_score_lower(query.lower(), text.lower())
+
+
+@functools.lru_cache(maxsize=4096)
+def match_score_lower(query_lower: str, text_lower: str) -> Tuple[int, int, int, str]:
+    """
+    calculate_match_score for already-lowercased inputs.
+    Memoized: completers rescore the same pairs on every redraw.
+    """
+    # A query longer than the text can't match it in any tier
+    if len(query_lower) > len(text_lower):
+        return (4, 0, len(text_lower), text_lower)
     
     # Exact match
     if query_lower == text_lower:
-        return (0, 0, len(text), text_lower)
+        return (0, 0, len(text_lower), text_lower)
     
     # Starts with
     if text_lower.startswith(query_lower):
-        return (1, 0, len(text), text_lower)
+        return (1, 0, len(text_lower), text_lower)
     
     # Contains as substring
     pos = text_lower.find(query_lower)
     if pos != -1:
-        return (2, -pos, len(text), text_lower)
+        return (2, -pos, len(text_lower), text_lower)
     
     # Fuzzy match (characters in order)
-    idx = 0
-    first_match_pos = -1
-    for i, ch in enumerate(text_lower):
-        if idx < len(query_lower) and ch == query_lower[idx]:
-            if first_match_pos == -1:
-                first_match_pos = i
-            idx += 1
+    # One str.find per query char; stop as soon as one is missing from the rest of the text
+    first_match_pos = pos = text_lower.find(query_lower[0])
+    for ch in query_lower[1:]:
+        if pos == -1:
+            break
+        pos = text_lower.find(ch, pos + 1)
     
-    if idx == len(query_lower):  # All chars found
-        return (3, -first_match_pos, len(text), text_lower)
+    if pos != -1:  # All chars found
+        return (3, -first_match_pos, len(text_lower), text_lower)
     
     # No match
-    return (4, 0, len(text), text_lower)
+    return (4, 0, len(text_lower), text_lower)
+
+
+class PrefixIndex:
+    """
+    Lowercased names kept sorted, so the names starting with a prefix are found by bisection
+    instead of a scan over the whole list. Build once per list and reuse across keystrokes.
+    """
+    
+    def __init__(self, names: List[str]):
+        self.names = names
+        self.names_lower = [name.lower() for name in names]
+        self._entries = sorted(zip(self.names_lower, range(len(names))))
+        self._keys = [key for key, _ in self._entries]
+        # Last fully scored query and the indices that matched it (see ranked())
+        self._last_query = None
+        self._last_matched = []
+    
+    def starting_with(self, prefix_lower: str) -> List[int]:
+        """Indices of names whose lowercase form starts with prefix_lower (equal names first)."""
+        indices = []
+        for pos in range(bisect.bisect_left(self._keys, prefix_lower), len(self._keys)):
+            key, i = self._entries[pos]
+            if not key.startswith(prefix_lower):
+                break
+            indices.append(i)
+        return indices
+    
+    def ranked(self, query_lower: str, top_k: Optional[int] = None) -> List[Tuple[Tuple[int, int, int, str], int]]:
+        """
+        (score, index) for the names matching query_lower, best first; all of them, or the top_k.
+        If the prefix range alone fills top_k only it is scored, since prefix matches outrank the
+        rest. If the query extends the previous full scan's, only names that matched then are
+        rescored: a name that can't match "fb" can't match "fbc" either.
+        """
+        names_lower = self.names_lower
+        if top_k is not None:
+            prefixed = self.starting_with(query_lower)
+            if len(prefixed) >= top_k:
+                matches = [(match_score_lower(query_lower, names_lower[i]), i) for i in prefixed]
+                return heapq.nsmallest(top_k, matches, key=lambda x: x[0])
+        
+        if self._last_query is not None and query_lower.startswith(self._last_query):
+            candidates = self._last_matched
+        else:
+            candidates = range(len(names_lower))
+        if HAS_RAPIDFUZZ and query_lower:
+            # Batch subsequence test in C: only names containing the query in order can score,
+            # so the Python scoring loop below only sees real matches
+            choices = names_lower if len(candidates) == len(names_lower) else [names_lower[i] for i in candidates]
+            hits = rf_process.extract(query_lower, choices, scorer=LCSseq.similarity,
+                                      processor=None, score_cutoff=len(query_lower), limit=None)
+            candidates = [candidates[idx] for idx in sorted(hit[2] for hit in hits)]
+        matches = []
+        for i in candidates:
+            score = match_score_lower(query_lower, names_lower[i])
+            if score[0] < 4:  # Only include actual matches
+                matches.append((score, i))
+        self._last_query = query_lower
+        self._last_matched = [i for _, i in matches]
+        
+        if top_k is not None:
+            # Partial selection; nsmallest is stable, so ties keep index order as a sort would
+            return heapq.nsmallest(top_k, matches, key=lambda x: x[0])
+        matches.sort(key=lambda x: x[0])
+        return matches
 
 
 class PackageCompleter(Completer):
@@ -99,6 +195,7 @@ class PackageCompleter(Completer):
     
     def __init__(self, packages: List[str]):
         self.packages = packages
+        self.index = PrefixIndex(packages)
     
     def get_completions(self, document, complete_event):
         text = document.text.strip()
@@ -115,27 +212,18 @@ class PackageCompleter(Completer):
                 )
             return
         
-        # Match by package name with scoring
-        matches = []
-        
-        for i, package in enumerate(self.packages, 1):
-            score = calculate_match_score(text, package)
-            if score[0] < 4:  # Only include actual matches
-                matches.append((score, i, package))
-        
-        # Sort by score (best matches first)
-        matches.sort(key=lambda x: x[0])
-        
-        # Yield completions
-        for score, idx, package in matches:
+        # Match by package name with scoring, best matches first
+        for score, i in self.index.ranked(text.lower()):
+            package = self.packages[i]
             yield Completion(
                 package,
                 start_position=-len(document.text),
-                display=f"[{idx}] {package}"
+                display=f"[{i + 1}] {package}"
             )
 
 
-def resolve_package_selection(user_input: str, packages: List[str]) -> Optional[int]:
+def resolve_package_selection(user_input: str, packages: List[str],
+                              index: Optional[PrefixIndex] = None) -> Optional[int]:
     """
     Resolve user input to package index (0-based).
     Prioritizes exact matches over fuzzy matches.
@@ -149,16 +237,17 @@ def resolve_package_selection(user_input: str, packages: List[str]) -> Optional[
             return idx
         return None
     
-    # First, try exact match (case-insensitive) - this handles dropdown selections
-    for i, package in enumerate(packages):
-        if package.lower() == user_lower:
-            return i
+    if index is None:
+        index = PrefixIndex(packages)
+    prefixed = index.starting_with(user_lower)
+    
+    # First, try exact match (case-insensitive) - this handles dropdown selections.
+    # Equal names sort first, lowest index first
+    if prefixed and index.names_lower[prefixed[0]] == user_lower:
+        return prefixed[0]
     
     # Then try starts-with match - prefer longer/more specific matches
-    starts_with_matches = []
-    for i, package in enumerate(packages):
-        if package.lower().startswith(user_lower):
-            starts_with_matches.append((len(package), i, package))
+    starts_with_matches = [(len(packages[i]), i, packages[i]) for i in prefixed]
     
     if starts_with_matches:
         # Sort by length (longer = more specific), then by index (stable order)
@@ -169,8 +258,9 @@ def resolve_package_selection(user_input: str, packages: List[str]) -> Optional[
     best_score = (4, 0, 0, '')  # Start with "no match"
     best_idx = None
     
-    for i, package in enumerate(packages):
-        score = calculate_match_score(user_input, package)
+    query_lower = user_input.lower()
+    for i, package_lower in enumerate(index.names_lower):
+        score = match_score_lower(query_lower, package_lower)
         if score < best_score:
             best_score = score
             best_idx = i
@@ -188,6 +278,7 @@ class PackageValidator(Validator):
     def __init__(self, count: int, packages: List[str]):
         self.count = count
         self.packages = packages
+        self.index = PrefixIndex(packages)
     
     def validate(self, document):
         t = document.text.strip()
@@ -202,7 +293,7 @@ class PackageValidator(Validator):
             raise ValidationError(message=f'Number must be 1..{self.count}')
         
         # Check if text matches any package
-        resolved = resolve_package_selection(t, self.packages)
+        resolved = resolve_package_selection(t, self.packages, index=self.index)
         if resolved is None:
             raise ValidationError(message='No matching package found')
         
@@ -265,6 +356,85 @@ def get_device_id():
         console.print("[red]❌ Invalid selection or error retrieving devices. Exiting.[/]")
         return None
 
+class AdbShell:
+    """
+    One long-lived `adb shell` per device. Commands are written to its stdin and their output is
+    read up to a sentinel line, so each command skips adb's process and connection setup.
+    Devices without shell_v2 (pre-Android 7) give an interactive shell a PTY that echoes the
+    prompt and commands into the output, so there each command runs as its own `adb shell`.
+    """
+    
+    SENTINEL = "__MRET_CMD_DONE__"
+    
+    def __init__(self, device_id: str):
+        self.device_id = device_id
+        self.proc = None
+        if has_shell_v2(device_id):
+            self.proc = subprocess.Popen(
+                ["adb", "-s", device_id, "shell"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            )
+    
+    def check_output(self, args: List[str]) -> str:
+        """Run a command in the shell; raises CalledProcessError on a non-zero exit, like subprocess."""
+        if self.proc is None:
+            return subprocess.check_output(["adb", "-s", self.device_id, "shell"] + args, text=True, stderr=subprocess.DEVNULL)
+        command = " ".join(shlex.quote(a) for a in args)
+        lines = []
+        try:
+            # A newline goes before the sentinel so output without a trailing newline can't hide it
+            self.proc.stdin.write(f"{command} 2>/dev/null; printf '\\n%s %s\\n' {self.SENTINEL} $?\n")
+            self.proc.stdin.flush()
+            for line in self.proc.stdout:
+                if line.startswith(self.SENTINEL):
+                    status = int(line.split()[1])
+                    output = "".join(lines)[:-1]  # Drop the newline printed before the sentinel
+                    if status != 0:
+                        raise subprocess.CalledProcessError(status, ["adb", "-s", self.device_id, "shell"] + args, output)
+                    return output
+                lines.append(line)
+        except BrokenPipeError:
+            pass
+        # The shell exited (device gone); drop it so the next call starts a fresh one
+        _adb_shells.pop(self.device_id, None)
+        raise subprocess.CalledProcessError(self.proc.wait() or 1, ["adb", "-s", self.device_id, "shell"] + args, "".join(lines))
+    
+    def close(self):
+        if self.proc is not None and self.proc.poll() is None:
+            try:
+                self.proc.stdin.close()  # EOF ends the remote shell
+                self.proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self.proc.kill()
+
+
+_adb_shells = {}
+
+
+def has_shell_v2(device_id: str) -> bool:
+    """True if the device's adbd supports shell protocol v2 (no PTY for piped shells)."""
+    try:
+        output = subprocess.check_output(["adb", "-s", device_id, "features"], text=True, stderr=subprocess.DEVNULL, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return "shell_v2" in output.replace(",", " ").split()
+
+
+def adb_shell(device_id: str) -> AdbShell:
+    """The shared AdbShell for device_id, started on first use."""
+    shell = _adb_shells.get(device_id)
+    if shell is None:
+        shell = _adb_shells[device_id] = AdbShell(device_id)
+    return shell
+
+
+@atexit.register
+def close_adb_shells():
+    for shell in _adb_shells.values():
+        shell.close()
+    _adb_shells.clear()
+
+
 def list_packages(exclude_system: bool, filter_system: bool, device_id: str):
     """
     List packages installed on the device.
@@ -273,30 +443,24 @@ def list_packages(exclude_system: bool, filter_system: bool, device_id: str):
     If filter_system is True, filters out known system packages like 'com.google', 'com.android'.
     """
     try:
-        cmd = ["adb", "-s", device_id, "shell", "pm", "list", "packages", "-3"] if exclude_system else ["adb", "-s", device_id, "shell", "pm", "list", "packages", "-a"]
-        output = subprocess.check_output(cmd, text=True)
-
-        packages = [line.replace("package:", "").strip() for line in output.splitlines()]
-
-        # Define system prefixes to filter out
-        system_prefixes = ("com.google", "com.android", "androidx", "com.qualcomm", "com.samsung", "android", "com.oplus", "net.oneplus", "com.oneplus", "oplus")
-
-        if filter_system:
-            packages = [pkg for pkg in packages if not pkg.startswith(system_prefixes)]
-
-        return packages
+        cmd = ["pm", "list", "packages", "-3"] if exclude_system else ["pm", "list", "packages", "-a"]
+        output = adb_shell(device_id).check_output(cmd)
+
+        # Filter on the raw lines in the same pass, so system packages are never copied out;
+        # startswith(()) is always False, which keeps every package line when not filtering
+        skip = SYSTEM_PACKAGE_LINE_PREFIXES if filter_system else ()
+        return [
+            line.replace("package:", "").strip() for line in output.splitlines()
+            if line.startswith("package:") and not line.startswith(skip)
+        ]
     except subprocess.CalledProcessError as e:
         console.print("[red]Error listing packages:[/red]", e)
         return []
 
 def get_apk_paths(package: str, device_id: str):
     try:
-        cmd = ["adb", "-s", device_id, "shell", "pm", "path", package]
-        output = subprocess.check_output(cmd, text=True, stderr=subprocess.DEVNULL).strip()
-        paths = []
-        for line in output.splitlines():
-            if line.startswith("package:"):
-                paths.append(line.replace("package:", "").strip())
+        output = adb_shell(device_id).check_output(["pm", "path", package])
+        paths = [line.replace("package:", "").strip() for line in output.splitlines() if line.startswith("package:")]
         if not paths:
             console.print(f"[yellow]⚠ No APK paths found for {package}[/]")
             return []
@@ -333,43 +497,32 @@ def merge_split_apks_manual(apk_files: List[str], output_path: str) -> bool:
     This is a fallback method when apksigner is not available.
     """
     try:
-        # Find base APK (usually the largest or named 'base.apk')
-        base_apk = None
-        base_size = 0
-        split_apks = []
-        
-        for apk in apk_files:
-            name = os.path.basename(apk).lower()
-            size = os.path.getsize(apk)
-            if 'base' in name or size > base_size:
-                if base_apk:
-                    split_apks.append(base_apk)
-                base_apk = apk
-                base_size = size
-            else:
-                split_apks.append(apk)
-        
-        if not base_apk:
-            base_apk = apk_files[0]
-            split_apks = apk_files[1:]
+        # Find base APK (named 'base.apk', otherwise the largest); stat each file once
+        entries = [(apk, os.path.basename(apk).lower(), os.path.getsize(apk)) for apk in apk_files]
+        base_apk = next((apk for apk, name, _ in entries if 'base' in name), None)
+        if base_apk is None:
+            base_apk = max(entries, key=lambda e: e[2])[0]
+        split_apks = [apk for apk, _, _ in entries if apk != base_apk]
         
         # Copy base APK to output
         shutil.copy2(base_apk, output_path)
         
         # Open output APK as zip
         with zipfile.ZipFile(output_path, 'a', zipfile.ZIP_DEFLATED) as out_zip:
-            # Get existing filenames from base APK
-            existing_files = set(out_zip.namelist())
-            
             # Merge contents from split APKs
             for split_apk in split_apks:
                 with zipfile.ZipFile(split_apk, 'r') as split_zip:
                     for item in split_zip.infolist():
-                        # Skip duplicate entries (base APK takes precedence)
-                        if item.filename not in existing_files:
-                            data = split_zip.read(item.filename)
-                            out_zip.writestr(item, data)
-                            existing_files.add(item.filename)  # Track added files
+                        # Skip duplicate entries (base APK takes precedence); NameToInfo
+                        # already tracks everything written so far, no separate set needed
+                        if item.filename not in out_zip.NameToInfo:
+                            if item.is_dir():
+                                out_zip.writestr(item, b"")
+                            else:
+                                # Stream in 1 MiB chunks instead of holding the whole entry in memory;
+                                # item keeps its compress_type, so STORED entries stay stored
+                                with split_zip.open(item) as src, out_zip.open(item, "w") as dst:
+                                    shutil.copyfileobj(src, dst, ZIP_COPY_BUFFER)
         
         return os.path.exists(output_path) and os.path.getsize(output_path) > 0
     except Exception as e:
@@ -401,11 +554,18 @@ def pull_apks(apk_paths, package_name, device_id):
     table.add_column("Local File", style="cyan")
     table.add_column("Status", style="yellow")
     
-    pulled_files = []
-    for p in apk_paths:
+    def pull_one(p):
         local_name = os.path.basename(p) if p.endswith(".apk") else f"{package_name}_{os.path.basename(p)}.apk"
         out_path = os.path.join(out_dir, local_name)
         res = subprocess.run(["adb", "-s", device_id, "pull", p, out_path], capture_output=True, text=True)
+        return p, local_name, out_path, res
+    
+    # Splits are independent transfers, so overlap their per-file adb latency
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(PULL_WORKERS, len(apk_paths)))) as executor:
+        results = list(executor.map(pull_one, apk_paths))
+    
+    pulled_files = []
+    for p, local_name, out_path, res in results:
         if res.returncode == 0:
             # If the file is named "base.apk", rename it to use the package name
             if local_name.lower() == "base.apk":
@@ -453,6 +613,8 @@ def main():
     device_id = get_device_id()
     if not device_id:
         return
+    # Start the device's shell now so its setup overlaps the prompt below
+    adb_shell(device_id)
 
     parser = argparse.ArgumentParser(description="List APKs from an Android device")
     parser.add_argument("--exclude-system", action="store_true", 
@@ -501,7 +663,7 @@ def main():
         return
 
     # Resolve selection
-    selected_index = resolve_package_selection(choice, packages)
+    selected_index = resolve_package_selection(choice, packages, index=validator.index)
     
     if selected_index is None:
         console.print("[red]❌ Invalid selection. Exiting.[/]")
@@ -4,6 +4,9 @@
 
 import os
 import sys
+import bisect
+import functools
+import heapq
 import re
 import shlex
 import time
@@ -31,6 +34,14 @@ from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.validation import Validator, ValidationError
 from typing import List, Tuple, Optional
 
+# Optional C implementation of the fuzzy (subsequence) match
+try:
+    from rapidfuzz import process as rf_process
+    from rapidfuzz.distance import LCSseq
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
 console = Console()
 
 # Config
@@ -118,39 +129,114 @@ def calculate_match_score(query: str, text: str) -> Tuple[int, int, int, str]:
     3 = Fuzzy match (chars in order)
     4 = No match
     """
-    query_lower = query.lower()
-    text_lower = text.lower()
+    return match_score_lower(query.lower(), text.lower())
+
+
+@functools.lru_cache(maxsize=4096)
+def match_score_lower(query_lower: str, text_lower: str) -> Tuple[int, int, int, str]:
+    """
+    calculate_match_score for already-lowercased inputs.
+    Memoized: completers rescore the same pairs on every redraw.
+    """
+    # A query longer than the text can't match it in any tier
+    if len(query_lower) > len(text_lower):
+        return (4, 0, len(text_lower), text_lower)
     
     # Exact match
     if query_lower == text_lower:
-        return (0, 0, len(text), text_lower)
+        return (0, 0, len(text_lower), text_lower)
     
     # Starts with
     if text_lower.startswith(query_lower):
-        return (1, 0, len(text), text_lower)
+        return (1, 0, len(text_lower), text_lower)
     
     # Contains as substring
     pos = text_lower.find(query_lower)
     if pos != -1:
-        return (2, -pos, len(text), text_lower)
+        return (2, -pos, len(text_lower), text_lower)
     
     # Fuzzy match (characters in order)
-    idx = 0
-    first_match_pos = -1
-    for i, ch in enumerate(text_lower):
-        if idx < len(query_lower) and ch == query_lower[idx]:
-            if first_match_pos == -1:
-                first_match_pos = i
-            idx += 1
+    # One str.find per query char; stop as soon as one is missing from the rest of the text
+    first_match_pos = pos = text_lower.find(query_lower[0])
+    for ch in query_lower[1:]:
+        if pos == -1:
+            break
+        pos = text_lower.find(ch, pos + 1)
     
-    if idx == len(query_lower):  # All chars found
-        return (3, -first_match_pos, len(text), text_lower)
+    if pos != -1:  # All chars found
+        return (3, -first_match_pos, len(text_lower), text_lower)
     
     # No match
-    return (4, 0, len(text), text_lower)
+    return (4, 0, len(text_lower), text_lower)
+
+
+class PrefixIndex:
+    """
+    Lowercased names kept sorted, so the names starting with a prefix are found by bisection
+    instead of a scan over the whole list. Build once per list and reuse across keystrokes.
+    """
+    
+    def __init__(self, names: List[str]):
+        self.names = names
+        self.names_lower = [name.lower() for name in names]
+        self._entries = sorted(zip(self.names_lower, range(len(names))))
+        self._keys = [key for key, _ in self._entries]
+        # Last fully scored query and the indices that matched it (see ranked())
+        self._last_query = None
+        self._last_matched = []
+    
+    def starting_with(self, prefix_lower: str) -> List[int]:
+        """Indices of names whose lowercase form starts with prefix_lower (equal names first)."""
+        indices = []
+        for pos in range(bisect.bisect_left(self._keys, prefix_lower), len(self._keys)):
+            key, i = self._entries[pos]
+            if not key.startswith(prefix_lower):
+                break
+            indices.append(i)
+        return indices
+    
+    def ranked(self, query_lower: str, top_k: Optional[int] = None) -> List[Tuple[Tuple[int, int, int, str], int]]:
+        """
+        (score, index) for the names matching query_lower, best first; all of them, or the top_k.
+        If the prefix range alone fills top_k only it is scored, since prefix matches outrank the
+        rest. If the query extends the previous full scan's, only names that matched then are
+        rescored: a name that can't match "fb" can't match "fbc" either.
+        """
+        names_lower = self.names_lower
+        if top_k is not None:
+            prefixed = self.starting_with(query_lower)
+            if len(prefixed) >= top_k:
+                matches = [(match_score_lower(query_lower, names_lower[i]), i) for i in prefixed]
+                return heapq.nsmallest(top_k, matches, key=lambda x: x[0])
+        
+        if self._last_query is not None and query_lower.startswith(self._last_query):
+            candidates = self._last_matched
+        else:
+            candidates = range(len(names_lower))
+        if HAS_RAPIDFUZZ and query_lower:
+            # Batch subsequence test in C: only names containing the query in order can score,
+            # so the Python scoring loop below only sees real matches
+            choices = names_lower if len(candidates) == len(names_lower) else [names_lower[i] for i in candidates]
+            hits = rf_process.extract(query_lower, choices, scorer=LCSseq.similarity,
+                                      processor=None, score_cutoff=len(query_lower), limit=None)
+            candidates = [candidates[idx] for idx in sorted(hit[2] for hit in hits)]
+        matches = []
+        for i in candidates:
+            score = match_score_lower(query_lower, names_lower[i])
+            if score[0] < 4:  # Only include actual matches
+                matches.append((score, i))
+        self._last_query = query_lower
+        self._last_matched = [i for _, i in matches]
+        
+        if top_k is not None:
+            # Partial selection; nsmallest is stable, so ties keep index order as a sort would
+            return heapq.nsmallest(top_k, matches, key=lambda x: x[0])
+        matches.sort(key=lambda x: x[0])
+        return matches
 
 
-def resolve_selection(user_input: str, items: List[str], names: Optional[List[str]] = None) -> Optional[int]:
+def resolve_selection(user_input: str, items: List[str], names: Optional[List[str]] = None,
+                      index: Optional[PrefixIndex] = None) -> Optional[int]:
     """
     Resolve user input to item index (0-based).
     Prioritizes exact matches over fuzzy matches.
@@ -167,16 +253,16 @@ def resolve_selection(user_input: str, items: List[str], names: Optional[List[st
             return idx
         return None
     
-    # First, try exact match (case-insensitive)
-    for i, name in enumerate(names):
-        if name.lower() == user_lower:
-            return i
+    if index is None:
+        index = PrefixIndex(names)
+    prefixed = index.starting_with(user_lower)
+    
+    # First, try exact match (case-insensitive); equal names sort first, lowest index first
+    if prefixed and index.names_lower[prefixed[0]] == user_lower:
+        return prefixed[0]
     
     # Then try starts-with match - prefer longer/more specific matches
-    starts_with_matches = []
-    for i, name in enumerate(names):
-        if name.lower().startswith(user_lower):
-            starts_with_matches.append((len(name), i, name))
+    starts_with_matches = [(len(names[i]), i, names[i]) for i in prefixed]
     
     if starts_with_matches:
         # Sort by length (longer = more specific), then by index (stable order)
@@ -187,8 +273,9 @@ def resolve_selection(user_input: str, items: List[str], names: Optional[List[st
     best_score = (4, 0, 0, '')
     best_idx = None
     
-    for i, name in enumerate(names):
-        score = calculate_match_score(user_input, name)
+    query_lower = user_input.lower()
+    for i, name_lower in enumerate(index.names_lower):
+        score = match_score_lower(query_lower, name_lower)
         if score < best_score:
             best_score = score
             best_idx = i
@@ -206,6 +293,7 @@ class DeviceCompleter(Completer):
     def __init__(self, devices: List):
         self.devices = devices
         self.device_ids = [dev.id for dev in devices]
+        self.index = PrefixIndex(self.device_ids)
     
     def get_completions(self, document, complete_event):
         text = document.text.strip()
@@ -223,20 +311,12 @@ class DeviceCompleter(Completer):
             return
         
         # Match by device ID with scoring
-        matches = []
-        for i, dev_id in enumerate(self.device_ids, 1):
-            dev = self.devices[i - 1]
-            score = calculate_match_score(text, dev_id)
-            if score[0] < 4:
-                matches.append((score, i, dev_id, dev.type))
-        
-        matches.sort(key=lambda x: x[0])
-        
-        for score, idx, dev_id, dev_type in matches:
+        for score, i in self.index.ranked(text.lower()):
+            dev_id = self.device_ids[i]
             yield Completion(
-                str(idx) if text.isdigit() or len(text) == 0 else dev_id,
+                str(i + 1) if text.isdigit() or len(text) == 0 else dev_id,
                 start_position=-len(document.text),
-                display=f"[{idx}] {dev_id} ({dev_type})"
+                display=f"[{i + 1}] {dev_id} ({self.devices[i].type})"
             )
 
 
@@ -246,6 +326,7 @@ class DeviceValidator(Validator):
     def __init__(self, count: int, device_ids: List[str]):
         self.count = count
         self.device_ids = device_ids
+        self.index = PrefixIndex(device_ids)
     
     def validate(self, document):
         t = document.text.strip()
@@ -258,7 +339,7 @@ class DeviceValidator(Validator):
                 return
             raise ValidationError(message=f'Number must be 1..{self.count}')
         
-        resolved = resolve_selection(t, self.device_ids)
+        resolved = resolve_selection(t, self.device_ids, index=self.index)
         if resolved is None:
             raise ValidationError(message='No matching device found')
 
@@ -268,6 +349,7 @@ class PackageCompleter(Completer):
     
     def __init__(self, packages: List[str]):
         self.packages = packages
+        self.index = PrefixIndex(packages)
     
     def get_completions(self, document, complete_event):
         text = document.text.strip()
@@ -284,20 +366,13 @@ class PackageCompleter(Completer):
                 )
             return
         
-        # Match by package name with scoring
-        matches = []
-        for i, package in enumerate(self.packages, 1):
-            score = calculate_match_score(text, package)
-            if score[0] < 4:
-                matches.append((score, i, package))
-        
-        matches.sort(key=lambda x: x[0])
-        
-        for score, idx, package in matches[:20]:  # Limit to top 20
+        # Match by package name with scoring (best 20)
+        for score, i in self.index.ranked(text.lower(), top_k=20):
+            package = self.packages[i]
             yield Completion(
                 package,
                 start_position=-len(document.text),
-                display=f"[{idx}] {package}"
+                display=f"[{i + 1}] {package}"
             )
 
 
@@ -307,6 +382,7 @@ class PackageValidator(Validator):
     def __init__(self, count: int, packages: List[str]):
         self.count = count
         self.packages = packages
+        self.index = PrefixIndex(packages)
     
     def validate(self, document):
         t = document.text.strip()
@@ -319,7 +395,7 @@ class PackageValidator(Validator):
                 return
             raise ValidationError(message=f'Number must be 1..{self.count}')
         
-        resolved = resolve_selection(t, self.packages)
+        resolved = resolve_selection(t, self.packages, index=self.index)
         if resolved is None:
             raise ValidationError(message='No matching package found')
 
@@ -330,6 +406,7 @@ class ScriptCompleter(Completer):
     def __init__(self, scripts: List[str]):
         self.scripts = scripts
         self.script_names = [os.path.basename(s) for s in scripts]
+        self.index = PrefixIndex(self.script_names)
     
     def get_completions(self, document, complete_event):
         text = document.text.strip()
@@ -353,20 +430,13 @@ class ScriptCompleter(Completer):
                 )
             return
         
-        # Match by script name with scoring
-        matches = []
-        for i, script_name in enumerate(self.script_names, 1):
-            score = calculate_match_score(text, script_name)
-            if score[0] < 4:
-                matches.append((score, i, script_name))
-        
-        matches.sort(key=lambda x: x[0])
-        
-        for score, idx, script_name in matches[:15]:  # Limit to top 15
+        # Match by script name with scoring (best 15)
+        for score, i in self.index.ranked(text.lower(), top_k=15):
+            script_name = self.script_names[i]
             yield Completion(
                 script_name,
                 start_position=-len(document.text),
-                display=f"[{idx}] {script_name}"
+                display=f"[{i + 1}] {script_name}"
             )
 
 
@@ -376,6 +446,7 @@ class ScriptValidator(Validator):
     def __init__(self, count: int, script_names: List[str]):
         self.count = count
         self.script_names = script_names
+        self.index = PrefixIndex(script_names)
     
     def validate(self, document):
         t = document.text.strip()
@@ -388,7 +459,7 @@ class ScriptValidator(Validator):
                 return
             raise ValidationError(message=f'Number must be 0..{self.count}')
         
-        resolved = resolve_selection(t, self.script_names)
+        resolved = resolve_selection(t, self.script_names, index=self.index)
         if resolved is None:
             raise ValidationError(message='No matching script found')
 
@@ -466,7 +537,7 @@ def select_device(devices):
                 return real_devices[idx - 1]
         
         # Try to resolve by device ID
-        resolved = resolve_selection(choice, device_ids)
+        resolved = resolve_selection(choice, device_ids, index=validator.index)
         if resolved is not None:
             return real_devices[resolved]
         
@@ -713,7 +784,7 @@ def select_package(packages):
                 return packages[idx - 1]
         
         # Try to resolve by package name
-        resolved = resolve_selection(choice, packages)
+        resolved = resolve_selection(choice, packages, index=validator.index)
         if resolved is not None:
             return packages[resolved]
         
@@ -769,7 +840,7 @@ def select_frida_script(default_folder=None):
                 return script_paths[idx - 1]
         
         # Try to resolve by script name
-        resolved = resolve_selection(choice, script_names)
+        resolved = resolve_selection(choice, script_names, index=validator.index)
         if resolved is not None:
             return script_paths[resolved]
         
@@ -23,13 +23,11 @@ setup(
         "Topic :: Security",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=[
         # Core dependencies from your requirements
         "beautifulsoup4>=4.13.0",
@@ -60,6 +58,8 @@ setup(
         "full": [
             "sortedcontainers>=2.4.0",
             "typing_extensions>=4.14.0",
+            "rapidfuzz>=3.0.0",
+            "isal>=1.0.0",
         ],
     },
     entry_points={